@@ -1,8 +1,11 @@
+import os
+import copy
 import logging
+from functools import partial
 
 from concurrent.futures import (
     ProcessPoolExecutor,
-    as_completed
+    ThreadPoolExecutor,
 )
 
 from tqdm import tqdm
@@ -11,7 +14,23 @@ from tqdm import tqdm
 logger = logging.getLogger(__name__)
 
 
+def _parse_annotation_of_id(parse_function, annotator_name, id_, annotation,
+                            copy_annotation=False):
+    # Module level function, so it can be pickled for the process pool
+    if copy_annotation:
+        annotation = copy.deepcopy(annotation)
+    try:
+        return parse_function(annotation)
+    except Exception as error:
+        msg = '{} parsing variant with id failed: {}'
+        raise type(error)(msg.format(annotator_name, id_))
+
+
 class Annotator():
+    # Batches of annotations smaller than this are parsed in threads, since
+    # starting the worker processes would take longer than the parsing:
+    MIN_ANNOTATIONS_FOR_PROCESS_POOL = 50
+
     def __init__(self):
         self.name = self.__class__.__name__
 
@@ -65,22 +84,44 @@ class Annotator():
 
     def _parse_annotations(self, annotations):
         """Parse a dict of annotations in parallel. Return a dictionary with
-        the same keys and the parsed annotations."""
-        parsed_annotations = {}
-        with ProcessPoolExecutor() as executor:
-            future_to_id = {}
-            for id_, annotation in annotations.items():
-                future = executor.submit(self._parse_annotation, annotation)
-                future_to_id[future] = id_
-            for future in tqdm(as_completed(future_to_id), total=len(future_to_id)):
-                id_ = future_to_id[future]
-                try:
-                    parsed_annotations[id_] = future.result()
-                except Exception as error:
-                    msg = '{} parsing variant with id failed: {}'
-                    raise type(error)(msg.format(self.name, id_))
-
-        return parsed_annotations
+        the same keys and the parsed annotations.
+
+        The number of workers is read from the env variable
+        ANOTALA_PARSE_WORKERS and defaults to the number of CPUs. Set it to 1
+        to parse in the main process (e.g. for debugging).
+
+        Some parsers modify the annotation they are given, so the ones parsed
+        in this process are copied first, to leave the passed annotations
+        as they are. The process pool gets copies anyway when they are
+        pickled."""
+        ids = list(annotations.keys())
+        n_workers = self._parse_workers()
+        in_process = (n_workers == 1 or
+                      len(ids) < self.MIN_ANNOTATIONS_FOR_PROCESS_POOL)
+        parse = partial(_parse_annotation_of_id, self._parse_annotation,
+                        self.name, copy_annotation=in_process)
+
+        if n_workers == 1:
+            parsed = map(parse, ids, annotations.values())
+            return dict(zip(ids, tqdm(parsed, total=len(ids))))
+
+        if len(ids) < self.MIN_ANNOTATIONS_FOR_PROCESS_POOL:
+            executor_class = ThreadPoolExecutor
+        else:
+            executor_class = ProcessPoolExecutor
+
+        # Send the annotations to the workers in chunks, rather than one by
+        # one, to save the inter-process communication overhead:
+        chunksize = max(1, len(ids) // (n_workers * 4))
+
+        with executor_class(n_workers) as executor:
+            parsed = executor.map(parse, ids, annotations.values(),
+                                  chunksize=chunksize)
+            return dict(zip(ids, tqdm(parsed, total=len(ids))))
+
+    @staticmethod
+    def _parse_workers():
+        return int(os.environ.get('ANOTALA_PARSE_WORKERS') or os.cpu_count())
 
     @staticmethod
     def _set_of_string_ids(ids):
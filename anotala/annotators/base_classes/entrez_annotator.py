@@ -1,16 +1,61 @@
+import os
+import sys
 import logging
+from io import TextIOWrapper
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import Bio
 from Bio import Entrez
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from tqdm import tqdm
 
 from anotala.annotators.base_classes import WebAnnotatorWithCache
-from anotala.helpers import set_email_for_entrez, grouped
+from anotala.helpers import set_email_for_entrez, IntervalLimiter
 
 
 logger = logging.getLogger(__name__)
 
 
+EUTILS_HOST = 'https://eutils.ncbi.nlm.nih.gov'
+EUTILS_URL = EUTILS_HOST + '/entrez/eutils/{service}.fcgi'
+
+
+def _create_entrez_session():
+    """
+    Create a requests.Session that keeps the connections to the E-utilities
+    alive between batches, and retries with exponential backoff when NCBI
+    throttles us (429) or fails temporarily.
+    """
+    retries = Retry(total=5, backoff_factor=1.0,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=None)  # Retry POSTs as well
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                          max_retries=retries)
+    session = requests.Session()
+    session.mount(EUTILS_HOST, adapter)
+    return session
+
+
+ENTREZ_SESSION = _create_entrez_session()
+
+# NCBI allows 3 requests per second, or 10 with an API key:
+# https://www.ncbi.nlm.nih.gov/books/NBK25497/
+# Biopython's Entrez functions space their calls to keep under that limit.
+# These limiters do the same for the requests sent through ENTREZ_SESSION,
+# and they are shared by all the threads and annotators:
+ENTREZ_LIMITERS = {
+    False: IntervalLimiter(1 / 3),
+    True: IntervalLimiter(1 / 10),  # With API key
+}
+
+
+def _entrez_api_key():
+    return Entrez.api_key or os.environ.get('NCBI_API_KEY')
+
+
 class EntrezAnnotator(WebAnnotatorWithCache):
     """
     Base class for annotators that use one of Entrez services. Classes that
@@ -39,13 +84,24 @@ class EntrezAnnotator(WebAnnotatorWithCache):
           response from Entrez should be handled by Entrez.read(). This works
           for some but not all DBs.
 
+        - optionally, an ITERPARSE_TAG class variable with the XML tag of
+          each entry in the response (e.g. 'VariationReport'). If set, the
+          response handle is passed as is to _annotations_by_id, so that it
+          can be parsed as a stream (see helpers.iter_xml_elements), instead
+          of reading the whole response into memory first.
+
         - as any WebAnnotatorWithCache, a _parse_annotation static or classmethod
     """
+    ITERPARSE_TAG = None
+
     def _batch_query(self, ids):
         """
         Use Entrez query service to fetch a list of IDs in batches, in the
         database defined in self.ENTREZ_PARAMS['db']. Yields dictionaries with
-        the annotations of each batch.
+        the annotations of each batch, in the order the batches are completed.
+
+        Up to self.max_concurrent_requests batches are fetched and parsed at
+        the same time in a pool of threads.
 
         If self.USE_ENTREZ_READER is set, the raw response will be handled by
         Entrez.read() method, instead of returned as is.
@@ -77,14 +133,13 @@ class EntrezAnnotator(WebAnnotatorWithCache):
                     .format(total, self.ENTREZ_PARAMS['db'],
                             min(self.batch_size, total)))
 
-        for ids_group, handle in self._query_method(list(ids)):
-            if hasattr(self, 'USE_ENTREZ_READER'):
-                response = Entrez.read(handle)
-            else:
-                response = handle.read()
-            handle.close()
-            batch_annotations = self._annotations_by_id(ids_group, response)
-            yield dict(batch_annotations)
+        with ThreadPoolExecutor(self.max_concurrent_requests) as executor:
+            futures = [executor.submit(self._fetch_batch, ids_group, request)
+                       for ids_group, request in self._query_method(list(ids))]
+
+            sys.stdout.flush()  # Hack to display tqdm progress bar correctly
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                yield future.result()
 
         #
         # See the comment above ^. This code doesn't fix the problem.
@@ -97,6 +152,31 @@ class EntrezAnnotator(WebAnnotatorWithCache):
             #  else:
                 #  del(os.environ['http_proxy'])
 
+    def _fetch_batch(self, ids_group, request):
+        """
+        Run the Entrez *request* for a group of IDs and parse the response.
+        Returns a dictionary with the annotations of the batch.
+        """
+        handle = request()
+        try:
+            if hasattr(self, 'USE_ENTREZ_READER'):
+                response = Entrez.read(handle)
+            elif self.ITERPARSE_TAG:
+                response = handle
+            else:
+                response = handle.read()
+            return dict(self._annotations_by_id(ids_group, response))
+        finally:
+            handle.close()
+
+    @property
+    def max_concurrent_requests(self):
+        # Number of batches fetched and parsed at the same time. This is not
+        # a rate limit: the threads still take turns in ENTREZ_LIMITERS to
+        # send their requests. More threads than NCBI's requests per second
+        # would just wait there:
+        return 10 if _entrez_api_key() else 3
+
     @property
     def _query_method(self):
         query_methods = {
@@ -118,41 +198,91 @@ class EntrezAnnotator(WebAnnotatorWithCache):
         }
         return batch_sizes[self.ENTREZ_SERVICE]
 
-    def _efetch_query(self, ids):
-        n_batchs = len(ids)//self.batch_size
-        for ids_group in tqdm(grouped(ids, self.batch_size), total=n_batchs):
-            handle = Entrez.efetch(id=','.join(ids_group),
-                                   **self.ENTREZ_PARAMS)
-            yield ids_group, handle
+    # The _*_query methods yield tuples of (ids_group, request), where the
+    # request is a callable that performs the query for that group of IDs
+    # and returns the response handle. The requests are run by _batch_query.
 
+    def _batches(self, ids):
+        """Split the list of *ids* in consecutive slices of batch_size."""
+        for offset in range(0, len(ids), self.batch_size):
+            yield ids[offset:offset+self.batch_size]
+
+    def _efetch_query(self, ids):
+        for ids_group in self._batches(ids):
+            request = partial(self._entrez_request, 'efetch',
+                              id=','.join(ids_group), **self.ENTREZ_PARAMS)
+            yield ids_group, request
 
     def _esummary_query(self, ids):
-        n_batchs = len(ids)//self.batch_size
-        for ids_group in tqdm(grouped(ids, self.batch_size), total=n_batchs):
-            handle = Entrez.esummary(db=self.ENTREZ_PARAMS['db'],
-                                     id=','.join(ids_group))
-            yield ids_group, handle
+        for ids_group in self._batches(ids):
+            request = partial(self._entrez_request, 'esummary',
+                              db=self.ENTREZ_PARAMS['db'],
+                              id=','.join(ids_group))
+            yield ids_group, request
 
     def _epost_query(self, ids):
         # Entrez POST queries are a two step process. You first POST your query
         # and get a WebEnv identifier and a QueryKey.
         logger.info('Create a serverside Job and get its ID')
-        handle = Entrez.epost(db=self.ENTREZ_PARAMS['db'], id=','.join(ids))
+        handle = self._entrez_request('epost', db=self.ENTREZ_PARAMS['db'],
+                                      id=','.join(ids))
         job_data = Entrez.read(handle)
+        handle.close()
 
         # Then you do a second query using the job data, and you get the
         # results in batches. More info:
         # http://biopython.org/DIST/docs/tutorial/Tutorial.html#sec:entrez-webenv
         logger.info('Get the results from the job in batches')
-        for offset in tqdm(list(range(0, len(ids), self.batch_size))):
-            fetch_handle = Entrez.efetch(
+        for offset in range(0, len(ids), self.batch_size):
+            request = partial(
+                    self._entrez_request,
+                    'efetch',
                     db=self.ENTREZ_PARAMS['db'],
                     retmode=self.ENTREZ_PARAMS['retmode'],
                     webenv=job_data['WebEnv'], query_key=job_data['QueryKey'],
                     retstart=offset, retmax=self.batch_size
                 )
 
-            yield ids[offset:offset+self.batch_size], fetch_handle
+            yield ids[offset:offset+self.batch_size], request
+
+    @staticmethod
+    def _entrez_request(service, **params):
+        """
+        Query an Entrez *service* (efetch, esummary, epost) with the given
+        params through the shared keep-alive ENTREZ_SESSION. Returns the
+        response as a file-like handle, like Biopython's Entrez functions do:
+        text for plain text responses, bytes otherwise (e.g. XML).
+
+        Requests with a list of IDs are sent as POST, the rest as GET.
+        The response body is streamed: it's read from the connection as the
+        handle is read. Close the handle to release the connection.
+
+        The NCBI API key is taken from Entrez.api_key or from the env
+        variable NCBI_API_KEY, if set. It raises NCBI's rate limit from
+        3 to 10 requests per second. Every request waits for its turn in
+        ENTREZ_LIMITERS before it's sent, to keep under that limit.
+        """
+        params = {**params, 'tool': Entrez.tool, 'email': Entrez.email}
+        api_key = _entrez_api_key()
+        if api_key:
+            params['api_key'] = api_key
+
+        url = EUTILS_URL.format(service=service)
+        ENTREZ_LIMITERS[bool(api_key)].wait()
+        if 'id' in params:
+            # Lists of IDs go in the body of a POST, as NCBI recommends for
+            # more than a few IDs: they can be too long for a GET URL, and
+            # they don't need to be percent-encoded into the query string.
+            response = ENTREZ_SESSION.post(url, data=params, stream=True)
+        else:
+            response = ENTREZ_SESSION.get(url, params=params, stream=True)
+        response.raise_for_status()
+
+        handle = response.raw
+        handle.decode_content = True  # Transparently gunzip the body
+        if response.headers.get('Content-Type', '').startswith('text/plain'):
+            return TextIOWrapper(handle, encoding=response.encoding or 'utf-8')
+        return handle
 
     @classmethod
     def _parse_element(cls, element):
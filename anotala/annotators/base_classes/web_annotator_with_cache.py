@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from anotala.annotators.base_classes import Annotator
 from anotala.cache import Cache, create_cache
@@ -34,9 +35,21 @@ class WebAnnotatorWithCache(Annotator):
           annotations retrieved from the web will be in JSON format. This lets
           PostgresCache know it can create a JSONB field in the database.
 
+        - an optional CACHE_PARSED_ANNOTATIONS=True class variable to also
+          cache the output of _parse_annotation() as JSON, so that cache hits
+          don't need to be parsed again. The parsed annotations are stored in
+          a separate namespace that includes PARSED_ANNOTATIONS_VERSION:
+          increase it whenever the parsing changes, to discard the old ones.
+          Otherwise, the parsed annotations in cache are served as they are,
+          even if the parsing code changed. That's why it's off by default:
+          callers can opt in per instance (annotator.CACHE_PARSED_ANNOTATIONS
+          = True) when they know the parsing is stable.
+
     """
     ANNOTATIONS_ARE_JSON = False  # Default to be overriden
     SOURCE_NAME = ''
+    CACHE_PARSED_ANNOTATIONS = False
+    PARSED_ANNOTATIONS_VERSION = 1
 
     def __init__(self, cache='redis', proxies=None, **cache_kwargs):
         """
@@ -50,6 +63,7 @@ class WebAnnotatorWithCache(Annotator):
         super().__init__()
         self.proxies = proxies
         self.cache_kwargs = cache_kwargs
+        self._ids_from_web = set()
 
         if isinstance(cache, Cache):
             self.cache = cache
@@ -74,6 +88,7 @@ class WebAnnotatorWithCache(Annotator):
         data).
         """
         annotations = {}
+        self._ids_from_web = set()
         if use_cache:
             logger.info('{} get info from cache'.format(self.name))
             cached_data = self.cache.get(
@@ -90,15 +105,63 @@ class WebAnnotatorWithCache(Annotator):
             if ids_to_annotate:
                 logger.info('{} get info from web for {} IDs'
                             .format(self.name, len(ids_to_annotate)))
-                for batch_annotations in self._batch_query(ids_to_annotate):
-                    self.cache.set(
+                # Each batch is cached in a background thread while the next
+                # one is fetched. A single thread keeps the writes in order.
+                with ThreadPoolExecutor(1) as cache_writer:
+                    cache_writes = []
+                    for batch_annotations in self._batch_query(ids_to_annotate):
+                        cache_writes.append(cache_writer.submit(
+                            self.cache.set,
                             batch_annotations,
                             namespace=self.SOURCE_NAME,
                             as_json=self.ANNOTATIONS_ARE_JSON
-                        )
-                    annotations.update(batch_annotations)
-                    ids_to_annotate = ids_to_annotate - batch_annotations.keys()
+                        ))
+                        annotations.update(batch_annotations)
+                        self._ids_from_web.update(batch_annotations.keys())
+                        ids_to_annotate = \
+                            ids_to_annotate - batch_annotations.keys()
+
+                    for cache_write in cache_writes:
+                        cache_write.result()  # Raise any cache errors
         else:
             logger.info('{} not using web'.format(self.name))
 
         return annotations
+
+    @property
+    def _parsed_namespace(self):
+        return '{}_parsed_v{}'.format(self.SOURCE_NAME,
+                                      self.PARSED_ANNOTATIONS_VERSION)
+
+    def _parse_annotations(self, annotations):
+        """
+        Parse a dict of annotations. If CACHE_PARSED_ANNOTATIONS is set, the
+        parsed annotations of the IDs that came from the cache are also read
+        from cache, and only the rest are parsed (and then cached).
+        """
+        if not self.CACHE_PARSED_ANNOTATIONS:
+            return super()._parse_annotations(annotations)
+
+        # Annotations just fetched from the web might have changed, so they
+        # are always parsed again:
+        ids_from_cache = annotations.keys() - self._ids_from_web
+        parsed_annotations = {}
+        if ids_from_cache:
+            parsed_annotations = self.cache.get(
+                    ids_from_cache,
+                    namespace=self._parsed_namespace,
+                    as_json=True
+                )
+
+        unparsed_annotations = {id_: annotation
+                                for id_, annotation in annotations.items()
+                                if id_ not in parsed_annotations}
+        if unparsed_annotations:
+            new_parsed_annotations = \
+                super()._parse_annotations(unparsed_annotations)
+            self.cache.set({id_: annotation for id_, annotation
+                            in new_parsed_annotations.items() if annotation},
+                           namespace=self._parsed_namespace, as_json=True)
+            parsed_annotations.update(new_parsed_annotations)
+
+        return parsed_annotations
@@ -1,9 +1,17 @@
 from more_itertools import one
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from anotala.annotators.base_classes import EntrezAnnotator
+from anotala.helpers import iter_xml_elements, parse_xml
 
 
+RCV_ACCESSION_XPATH = etree.XPath(".//ClinVarAccession[@Type='RCV']/@Acc")
+TITLE_XPATH = etree.XPath('.//Title')
+MEASURE_SET_XPATH = etree.XPath('.//MeasureSet')
+MEASURE_XPATH = etree.XPath('.//Measure')
+ATTRIBUTE_XPATH = etree.XPath('.//AttributeSet//Attribute')
+XREF_DBSNP_XPATH = etree.XPath(".//XRef[@DB='dbSNP'][@Type='rs']")
+
 
 class ClinvarRCVAnnotator(EntrezAnnotator):
     """
@@ -15,40 +23,40 @@ class ClinvarRCVAnnotator(EntrezAnnotator):
         'db': 'clinvar',
         'rettype': 'clinvarset',
     }
+    ITERPARSE_TAG = 'ClinVarSet'
 
-    @staticmethod
-    def _annotations_by_id(ids, multi_accession_xml):
+    @classmethod
+    def _annotations_by_id(cls, ids, multi_accession_xml):
         """
-        Given an XML response with many <ClinVarSet> elements,
-        yield tuples of (RCV accession number, ClinVarSet XML).
+        Given an XML response with many <ClinVarSet> elements (as a string or
+        a file-like handle), yield tuples of (RCV accession number, ClinVarSet
+        XML).
         """
-        soup = BeautifulSoup(multi_accession_xml, 'lxml-xml')
-
-        for clinvar_set in soup.select('ClinVarSet'):
-            accessions = [element['Acc'] for element in
-                          clinvar_set.find_all('ClinVarAccession')
-                          if element.get('Type') == 'RCV']
+        for clinvar_set in iter_xml_elements(multi_accession_xml,
+                                             cls.ITERPARSE_TAG):
+            accessions = RCV_ACCESSION_XPATH(clinvar_set)
 
             try:
-                accession = one(accessions)
+                accession = str(one(accessions))
             except ValueError:
                 raise ValueError('{} accessions found (expecting one).'
                                  .format(len(accessions)))
 
-            yield (accession, str(clinvar_set))
+            yield (accession, etree.tostring(clinvar_set, encoding='unicode',
+                                             with_tail=False))
 
     @classmethod
     def _parse_annotation(cls, clinvar_set_xml):
         info = {}
 
-        soup = BeautifulSoup(clinvar_set_xml, 'lxml-xml')
+        clinvar_set = parse_xml(clinvar_set_xml)
 
-        info['accession'] = cls._extract_accession(soup)
-        info['entry_type'] = cls._extract_entry_type(soup)
-        info['title'] = cls._extract_title(soup)
-        info['attributes'] = cls._extract_attributes(soup)
+        info['accession'] = cls._extract_accession(clinvar_set)
+        info['entry_type'] = cls._extract_entry_type(clinvar_set)
+        info['title'] = cls._extract_title(clinvar_set)
+        info['attributes'] = cls._extract_attributes(clinvar_set)
 
-        dbsnp_id = cls._extract_dbsnp_id(soup)
+        dbsnp_id = cls._extract_dbsnp_id(clinvar_set)
 
         if dbsnp_id:
             info['dbsnp_id'] = dbsnp_id
@@ -56,19 +64,20 @@ class ClinvarRCVAnnotator(EntrezAnnotator):
         return info
 
     @staticmethod
-    def _extract_title(soup):
-        return soup.find('Title').text.strip()
+    def _extract_title(clinvar_set):
+        title = TITLE_XPATH(clinvar_set)[0]
+        return ''.join(title.itertext()).strip()
 
     @staticmethod
-    def _extract_attributes(soup):
+    def _extract_attributes(clinvar_set):
         attributes = []
-        measure_sets = soup.select('MeasureSet')
+        measure_sets = MEASURE_SET_XPATH(clinvar_set)
         for measure_set in measure_sets:
-            for measure in measure_set.select('Measure'):
-                for attribute in measure.select('AttributeSet Attribute'):
+            for measure in MEASURE_XPATH(measure_set):
+                for attribute in ATTRIBUTE_XPATH(measure):
                     info = {key.lower(): val
-                            for key, val in attribute.attrs.items()}
-                    info['full_name'] = attribute.text.strip()
+                            for key, val in attribute.attrib.items()}
+                    info['full_name'] = ''.join(attribute.itertext()).strip()
                     info['measureset_type'] = measure_set.get('Type')
                     info['measure_type'] = measure.get('Type')
                     info['measuresets_in_this_entry'] = len(measure_sets)
@@ -76,16 +85,15 @@ class ClinvarRCVAnnotator(EntrezAnnotator):
         return attributes
 
     @staticmethod
-    def _extract_dbsnp_id(soup):
-        xref = soup.find('XRef', attrs={'DB': 'dbSNP', 'Type': 'rs'})
-        if xref:
-            return 'rs' + xref['ID']
+    def _extract_dbsnp_id(clinvar_set):
+        xrefs = XREF_DBSNP_XPATH(clinvar_set)
+        if xrefs:
+            return 'rs' + xrefs[0].attrib['ID']
 
     @staticmethod
-    def _extract_accession(soup):
-        return soup.find('ClinVarAccession', attrs={'Type': 'RCV'})['Acc']
+    def _extract_accession(clinvar_set):
+        return str(RCV_ACCESSION_XPATH(clinvar_set)[0])
 
     @staticmethod
-    def _extract_entry_type(soup):
-        return soup.find('MeasureSet')['Type']
-
+    def _extract_entry_type(clinvar_set):
+        return MEASURE_SET_XPATH(clinvar_set)[0].attrib['Type']
@@ -31,6 +31,7 @@ def _build_variant_regex():
     patterns['no_transcript'] = \
         r'{gene}:{cds} {prot_change}'.format(**patterns)
 
+    # In order of preference:
     pattern_names = 'full_name no_protchange no_transcript'.split()
     return {pattern_name: re.compile(patterns[pattern_name])
             for pattern_name in pattern_names}
@@ -115,16 +116,12 @@ class ClinvarRsAnnotator(MyVariantAnnotator):
 
     @classmethod
     def _parse_preferred_name(cls, preferred_name):
-        matches_1 = cls.VARIANT_REGEX['full_name'].search(preferred_name)
-        matches_2 = cls.VARIANT_REGEX['no_protchange'].search(preferred_name)
-        matches_3 = cls.VARIANT_REGEX['no_transcript'].search(preferred_name)
-
-        if matches_1:
-            return matches_1.groupdict()
-        if matches_2:
-            return matches_2.groupdict()
-        if matches_3:
-            return matches_3.groupdict()
+        # The patterns are tried from the most to the least complete one
+        # (see _build_variant_regex), stopping at the first that matches:
+        for regex in cls.VARIANT_REGEX.values():
+            matches = regex.search(preferred_name)
+            if matches:
+                return matches.groupdict()
 
         return {}
 
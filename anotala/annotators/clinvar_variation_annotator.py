@@ -1,11 +1,90 @@
+import re
 from collections import defaultdict, Counter
+from itertools import chain
 
 from more_itertools import one
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from anotala.annotators.base_classes import EntrezAnnotator
 from anotala.annotators import ClinvarRsAnnotator
-from anotala.helpers import is_incidental_pheno
+from anotala.helpers import is_incidental_pheno, iter_xml_elements, parse_xml
+
+
+# XPath expressions are compiled once here, instead of having the selectors
+# parsed again for every variation:
+VARIATION_REPORT_XPATH = etree.XPath("descendant-or-self::VariationReport")
+GERMLINE_XPATH = etree.XPath(".//ClinicalAssertionList/GermlineList/Germline")
+SOMATIC_XPATH = etree.XPath(".//ClinicalAssertionList/SomaticList/Somatic")
+ASSERTION_XPATHS = (('germline', GERMLINE_XPATH), ('somatic', SOMATIC_XPATH))
+CLINSIG_XPATH = etree.XPath(".//ClinicalSignificance")
+DESCRIPTION_XPATH = etree.XPath(".//Description")
+CITATION_XPATH = etree.XPath(".//Citation")
+CITATION_ID_XPATH = etree.XPath(".//ID")
+METHOD_XPATH = etree.XPath(".//Method")
+COMMENT_XPATH = etree.XPath(".//Comment")
+PHENOTYPE_LIST_XPATH = etree.XPath(".//PhenotypeList")
+PHENOTYPE_XPATH = etree.XPath(".//Phenotype")
+PHENOTYPE_OMIM_XPATH = etree.XPath(".//XRefList/XRef[@DB='OMIM']")
+OBSERVATION_XPATH = etree.XPath(
+    ".//ObservationList/Observation[@VariationID=$variation_id]"
+)
+REVIEW_STATUS_XPATH = etree.XPath(".//ReviewStatus")
+GENE_LIST_XPATH = etree.XPath(".//GeneList")
+GENES_XPATH = etree.XPath(".//GeneList/Gene")
+GENE_XPATH = etree.XPath(".//Gene")
+GENE_OMIM_XPATH = etree.XPath(".//OMIM")
+ALLELE_XPATH = etree.XPath(".//Allele")
+
+# Separators in a composite clinical significance, like
+# "Pathogenic/Likely pathogenic, risk factor":
+CLINSIG_SEPARATOR = re.compile(r'\s*[/,]\s*')
+
+# Genome assemblies read from each allele's <SequenceLocation>s, with the
+# suffix used for their keys in the parsed info (e.g. 'start_g37'):
+ASSEMBLIES = (
+    ('g37', 'GRCh37'),
+    ('g38', 'GRCh38'),
+)
+
+# Keys of the parsed info for the external DB of each allele's <XRef>:
+XREF_KEYS = {
+    'dbSNP': 'dbsnp_id',
+    'OMIM': 'omim_id',
+    'UniProtKB': 'uniprot_id',
+}
+
+# The elements read from each <Allele> are collected in a single walk over
+# its subtree (see _allele_elements), instead of one XPath query per field:
+ALLELE_TAGS = (
+    'Name',
+    'VariantType',
+    'SequenceLocation',
+    'HGVSlist',
+    'XRef',
+    'MolecularConsequence',
+    'AlleleFrequency',
+)
+
+
+def _first(elements):
+    """Return the first of the matched *elements*, or None if empty."""
+    return elements[0] if elements else None
+
+
+def _text(element):
+    """Return all the text inside an *element*, including its children's."""
+    return ''.join(element.itertext())
+
+
+def _allele_elements(allele):
+    """
+    Walk the subtree of an <Allele> once and return a dict with the
+    descendants of each of the ALLELE_TAGS, in document order.
+    """
+    elements = {tag: [] for tag in ALLELE_TAGS}
+    for element in allele.iterdescendants(*ALLELE_TAGS):
+        elements[element.tag].append(element)
+    return elements
 
 
 class ClinvarVariationAnnotator(EntrezAnnotator):
@@ -19,26 +98,32 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         'rettype': 'variation',
     }
     BATCH_SIZE = 200
+    ITERPARSE_TAG = 'VariationReport'
 
     @classmethod
     def _annotations_by_id(cls, ids, xml):
         """
-        Given an XML response with many <VariationReport> elements,
-        yield tuples of (Variation ID, XML for that variation).
+        Given an XML response with many <VariationReport> elements (as a
+        string or a file-like handle), yield tuples of (Variation ID, XML
+        for that variation).
         """
-        soup = BeautifulSoup(xml, 'lxml-xml')
-
-        for variation_report in soup.select('VariationReport'):
+        for variation_report in iter_xml_elements(xml, cls.ITERPARSE_TAG):
             variation_id = cls._extract_variation_id(variation_report)
-            yield (variation_id, str(variation_report))
+            yield (variation_id, etree.tostring(variation_report,
+                                                encoding='unicode',
+                                                with_tail=False))
 
     @classmethod
     def _parse_annotation(cls, variation_xml):
+        """
+        Parse a single <VariationReport>. Accepts either its XML (str or
+        bytes, e.g. from cache) or an already parsed lxml element, which
+        is used as is.
+        """
         info = {}
 
-        soup = BeautifulSoup(variation_xml, 'lxml-xml')
-        variation_reports = soup.select('VariationReport')
-        variation_report = one(variation_reports)
+        root = parse_xml(variation_xml)
+        variation_report = one(VARIATION_REPORT_XPATH(root))
 
         info['variation_id'] = cls._extract_variation_id(variation_report)
         info['url'] = cls._url(info['variation_id'])
@@ -82,15 +167,16 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         Given the info dict of a Variation, if it's a Haplotype, extract
         the dbSNP IDs of its alleles into a list at level 0 of the dict.
         """
-        if info.get('variation_type') == 'Haplotype':
-            dbsnp_ids = [allele.get('dbsnp_id') for allele in info['alleles']]
-            dbsnp_ids = [id_ for id_ in dbsnp_ids if id_]
-            info.update({'dbsnp_ids': dbsnp_ids})
+        if info.get('variation_type') != 'Haplotype':
+            return
+
+        info['dbsnp_ids'] = [allele['dbsnp_id'] for allele in info['alleles']
+                             if allele.get('dbsnp_id')]
 
     @staticmethod
-    def _extract_variation_id(variation_soup):
-        """Extract the Variation ID from a ClinVar variation HTML soup."""
-        return variation_soup['VariationID']
+    def _extract_variation_id(variation_report):
+        """Extract the Variation ID from a ClinVar <VariationReport>."""
+        return variation_report.attrib['VariationID']
 
     @staticmethod
     def _parse_clinical_significances(clinsigs):
@@ -99,41 +185,31 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         a list with the values seen. Deals with some complex significances like
         "Pathogenic/Likely pathogenic, Affects, risk factor".
         """
-        clinical_significances = []
-        for sig_ in clinsigs.split('/'):
-            for sig in sig_.split(','):
-                clinical_significance = sig.strip()
-                if clinical_significance not in clinical_significances:
-                    clinical_significances.append(clinical_significance)
-        return clinical_significances
+        # The separator takes the spaces around it, so the values need no
+        # stripping. A dict keeps the order of the values seen and dedupes them:
+        return list(dict.fromkeys(CLINSIG_SEPARATOR.split(clinsigs.strip())))
 
 
     @staticmethod
-    def _extract_variation_name(variation_soup):
-        """Extract the Variation name from a ClinVar variation HTML soup."""
-        return variation_soup['VariationName']
+    def _extract_variation_name(variation_report):
+        """Extract the Variation name from a ClinVar <VariationReport>."""
+        return variation_report.attrib['VariationName']
 
     @staticmethod
-    def _extract_variation_type(variation_soup):
-        """Extract the Variation type from a ClinVar variation HTML soup."""
-        return variation_soup.get('VariationType')
+    def _extract_variation_type(variation_report):
+        """Extract the Variation type from a ClinVar <VariationReport>."""
+        return variation_report.get('VariationType')
 
     @classmethod
-    def _extract_clinical_assertions(cls, variation_soup):
+    def _extract_clinical_assertions(cls, variation_report):
         """
         Extract the clinical assertions from a ClinVar variation, both from
         GermlineList and from SomaticList.
         """
         clinical_assertions = []
 
-        selectors = {
-            'germline': 'ClinicalAssertionList > GermlineList > Germline',
-            'somatic': 'ClinicalAssertionList > SomaticList > Somatic',
-        }
-
-        for assertion_type, selector in selectors.items():
-            assertions = variation_soup.select(selector)
-            for assertion in assertions:
+        for assertion_type, xpath in ASSERTION_XPATHS:
+            for assertion in xpath(variation_report):
                 info = cls._parse_clinical_assertion(assertion)
                 info['type'] = assertion_type
                 clinical_assertions.append(info)
@@ -143,10 +219,10 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
     @classmethod
     def _parse_clinical_assertion(cls, assertion):
         info = {}
-        info['submitter_name'] = assertion['SubmitterName']
-        info['date_last_submitted'] = assertion['DateLastSubmitted']
-        clinsig = one(assertion.select('ClinicalSignificance'))
-        clinsig_description = clinsig.select_one('Description').text
+        info['submitter_name'] = assertion.attrib['SubmitterName']
+        info['date_last_submitted'] = assertion.attrib['DateLastSubmitted']
+        clinsig = one(CLINSIG_XPATH(assertion))
+        clinsig_description = _text(DESCRIPTION_XPATH(clinsig)[0])
         info['clinical_significances'] = cls._parse_clinical_significances(
             clinsig_description
         )
@@ -155,15 +231,15 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         # per Variation, then all these sub-keys inside the dictionary
         # could live in the parent level, info:
         info['clinical_significance_detail'] = {
-            'description': clinsig.select_one('Description').text,
+            'description': clinsig_description,
             'citations': [cls._parse_citation(citation) for citation in
-                          clinsig.select('Citation')],
-            'method': one(clinsig.select('Method')).text,
+                          CITATION_XPATH(clinsig)],
+            'method': _text(one(METHOD_XPATH(clinsig))),
             'comments': [cls._parse_comment(comment) for comment in
-                         clinsig.select('Comment')]
+                         COMMENT_XPATH(clinsig)]
         }
 
-        phenotype_lists = assertion.select('PhenotypeList')
+        phenotype_lists = PHENOTYPE_LIST_XPATH(assertion)
         if phenotype_lists:
             # We assume there is one PhenotypeList per clinical assertion:
             phenotype_list = one(phenotype_lists)
@@ -173,80 +249,79 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
 
     @staticmethod
     def _parse_citation(citation):
-        info = {'type': citation['Type']}
-        for id_ in citation.select('ID'):
-            source = id_['Source']
+        info = {'type': citation.attrib['Type']}
+        for id_ in CITATION_ID_XPATH(citation):
+            source = id_.attrib['Source']
             if source == 'PubMed':
                 source = 'pmid'
-            info[source] = id_.text
+            info[source] = _text(id_)
         return info
 
     @staticmethod
     def _parse_comment(comment):
         return {
-            'data_source': comment['DataSource'],
-            'type': comment['Type'],
-            'text': comment.text.strip(),
+            'data_source': comment.attrib['DataSource'],
+            'type': comment.attrib['Type'],
+            'text': _text(comment).strip(),
         }
 
     @staticmethod
     def _parse_phenotype_list(phenotype_list):
         """
-        Expects a BeautifulSoup <PhenotypeList> element. It parses the
+        Expects an lxml <PhenotypeList> element. It parses the
         <Phenotype>s inside and returns them as a list of dictionaries,
         like: [{'name': 'Pheno-1'}, {'name': 'Pheno-2', 'omim_id': 'MIM-1'}].
         """
         phenos = []
 
-        for pheno_element in phenotype_list.select('Phenotype'):
-            pheno_info = {'name': pheno_element['Name']}
-            omim = pheno_element.select_one('XRefList > XRef[DB=OMIM]')
-            if omim:
-                pheno_info['omim_id'] = omim['ID']
-                pheno_info['incidental'] = is_incidental_pheno(omim['ID'])
+        for pheno_element in PHENOTYPE_XPATH(phenotype_list):
+            pheno_info = {'name': pheno_element.attrib['Name']}
+            omim = _first(PHENOTYPE_OMIM_XPATH(pheno_element))
+            if omim is not None:
+                pheno_info['omim_id'] = omim.attrib['ID']
+                pheno_info['incidental'] = is_incidental_pheno(omim.attrib['ID'])
             phenos.append(pheno_info)
 
         return phenos
 
     @classmethod
-    def _extract_observation(cls, variation_soup):
+    def _extract_observation(cls, variation_report):
         """
         Parses the <ObservationList> to get the single <Observation> that
         belongs to the current Variation ID. Returns the observation as a
         dictionary.
         """
-        variation_id = cls._extract_variation_id(variation_soup)
-        selector = ('ObservationList > Observation[VariationID={}]'
-                    .format(variation_id))
-        observation_el = one(variation_soup.select(selector))
+        variation_id = cls._extract_variation_id(variation_report)
+        observation_el = one(OBSERVATION_XPATH(variation_report,
+                                               variation_id=variation_id))
 
         observation = {
             'variation_id': variation_id,
-            'type': observation_el['ObservationType'],
+            'type': observation_el.attrib['ObservationType'],
         }
 
-        review_status = one(observation_el.select('ReviewStatus'))
-        observation['review_status'] = review_status.text
+        review_status = one(REVIEW_STATUS_XPATH(observation_el))
+        observation['review_status'] = _text(review_status)
 
-        clinsig = one(observation_el.select('ClinicalSignificance'))
+        clinsig = one(CLINSIG_XPATH(observation_el))
         observation['clinical_significances'] = cls._parse_clinical_significances(
-            clinsig.select_one('Description').text
+            _text(DESCRIPTION_XPATH(clinsig)[0])
         )
 
         observation['date_last_evaluated'] = clinsig.get('DateLastEvaluated')
 
-        phenotype_list = one(observation_el.select('PhenotypeList'))
+        phenotype_list = one(PHENOTYPE_LIST_XPATH(observation_el))
         observation['phenotypes'] = cls._parse_phenotype_list(phenotype_list)
 
         return observation
 
 
     @staticmethod
-    def _extract_genes(variation_soup):
+    def _extract_genes(variation_report):
         """
-        Extract the Variation gene list from a ClinVar variation HTML soup.
+        Extract the Variation gene list from a ClinVar <VariationReport>.
         """
-        genes = variation_soup.select('GeneList > Gene')
+        genes = GENES_XPATH(variation_report)
 
         gene_dicts = []
 
@@ -259,38 +334,41 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
             }
 
             if gene.get('HGNCID'):
-                gene_info['hgnc_id'] = gene['HGNCID'].replace('HGNC:', '')
+                gene_info['hgnc_id'] = gene.get('HGNCID').replace('HGNC:', '')
 
-            omim = gene.select_one('OMIM')
-            if omim:
-                gene_info['omim_id'] = omim.text
+            omim = _first(GENE_OMIM_XPATH(gene))
+            if omim is not None:
+                gene_info['omim_id'] = _text(omim)
 
             gene_dicts.append(gene_info)
 
         return gene_dicts
 
     @staticmethod
-    def _extract_single_gene_name(variation_soup):
+    def _extract_single_gene_name(variation_report):
         """Extract the gene symbol (i.e. name, like BRAC1) from a ClinVar
         variation, if there's only one gene. Return None if there are multiple
         genes."""
-        gene_list = variation_soup.select_one('GeneList')
-        if gene_list and gene_list['GeneCount'] == "1":
-            return gene_list.select_one('Gene')['Symbol']
+        gene_list = _first(GENE_LIST_XPATH(variation_report))
+        if gene_list is not None and gene_list.get('GeneCount') == "1":
+            return GENE_XPATH(gene_list)[0].attrib['Symbol']
 
     @classmethod
-    def _extract_alleles(cls, variation_soup):
+    def _extract_alleles(cls, variation_report):
         """Extract the Variation alleles from a ClinVar variation."""
         alleles = []
-        for allele in variation_soup.select('Allele'):
+        for allele in ALLELE_XPATH(variation_report):
+            elements = _allele_elements(allele)
             info = {}
 
-            info.update(cls._extract_allele_basic_info(allele))
-            info.update(cls._extract_sequence_info_from_allele(allele))
-            info.update(cls._extract_allele_hgvs(allele))
-            info.update(cls._extract_xrefs(allele))
-            info['consequences'] = cls._extract_molecular_consequences(allele)
-            info['frequencies'] = cls._extract_allele_frequencies(allele)
+            info.update(cls._extract_allele_basic_info(allele, elements))
+            info.update(cls._extract_sequence_info_from_allele(allele, elements))
+            info.update(cls._extract_allele_hgvs(allele, elements))
+            info.update(cls._extract_xrefs(allele, elements))
+            info['consequences'] = \
+                cls._extract_molecular_consequences(allele, elements)
+            info['frequencies'] = \
+                cls._extract_allele_frequencies(allele, elements)
 
             info['consequences_functions'] = \
                 sorted({consequence['function']
@@ -301,60 +379,54 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         return alleles
 
 
+    # The _extract_* methods for an <Allele> take the *elements* collected
+    # by _allele_elements(allele). If not passed, the allele is walked.
+
     @staticmethod
-    def _extract_allele_basic_info(allele):
-        """Given an <Allele> BS node, extract its basic info into a dict."""
+    def _extract_allele_basic_info(allele, elements=None):
+        """Given an <Allele> element, extract its basic info into a dict."""
+        elements = elements or _allele_elements(allele)
         info = {}
-        info['allele_id'] = allele['AlleleID']
-        info['name'] = allele.select_one('Name').text
-        info['variant_type'] = allele.select_one('VariantType').text
+        info['allele_id'] = allele.attrib['AlleleID']
+        info['name'] = _text(elements['Name'][0])
+        info['variant_type'] = _text(elements['VariantType'][0])
         return info
 
     @staticmethod
-    def _extract_sequence_info_from_allele(allele):
-        """Given an <Allele> BS node, extract SequenceLocation info into a dict."""
-        g37 = allele.select_one('SequenceLocation[Assembly="GRCh37"]')
-        g38 = allele.select_one('SequenceLocation[Assembly="GRCh38"]')
+    def _extract_sequence_info_from_allele(allele, elements=None):
+        """Given an <Allele> element, extract SequenceLocation info into a dict."""
+        elements = elements or _allele_elements(allele)
+
+        locations = {}
+        for location in elements['SequenceLocation']:
+            locations.setdefault(location.get('Assembly'), location)
 
         info = {}
 
-        if g37:
+        for suffix, assembly in ASSEMBLIES:
+            location = locations.get(assembly)
+            if location is None:
+                continue
+
             # Copy Numbers have an "innerStart" instead of "start"
-            start = g37.get('start') or g37.get('innerStart')
+            start = location.get('start') or location.get('innerStart')
             if start:
-                info['start_g37'] = int(start)
+                info['start_' + suffix] = int(start)
 
             # Copy Numbers have an "innerStop" instead of "stop"
-            stop = g37.get('stop') or g37.get('innerStop')
+            stop = location.get('stop') or location.get('innerStop')
             if stop:
-                info['stop_g37'] = int(stop)
+                info['stop_' + suffix] = int(stop)
 
-            info['accession_g37'] = g37.get('Accession')
+            info['accession_' + suffix] = location.get('Accession')
 
-            length = g37.get('variantLength')
+            length = location.get('variantLength')
             if length:
-                info['length_g37'] = int(length)
+                info['length_' + suffix] = int(length)
 
-            info['ref_g37'] = g37.get('referenceAllele')
-            info['alt_g37'] = g37.get('alternateAllele')
-            info['chrom_g37'] = g37.get('Chr')
-
-        if g38:
-            start = g38.get('start') or g38.get('innerStart')
-            info['start_g38'] = int(start)
-
-            stop = g38.get('stop') or g38.get('innerStop')
-            info['stop_g38'] = int(stop)
-
-            info['accession_g38'] = g38.get('Accession')
-
-            length = g38.get('variantLength')
-            if length:
-                info['length_g38'] = int(length)
-
-            info['ref_g38'] = g38.get('referenceAllele')
-            info['alt_g38'] = g38.get('alternateAllele')
-            info['chrom_g38'] = g38.get('Chr')
+            info['ref_' + suffix] = location.get('referenceAllele')
+            info['alt_' + suffix] = location.get('alternateAllele')
+            info['chrom_' + suffix] = location.get('Chr')
 
         # Figure out the nucleotide/allele that this <Alelle> entry refers to:
         # For instance, the change A>G refers to allele "G", which is stored
@@ -369,98 +441,112 @@ class ClinvarVariationAnnotator(EntrezAnnotator):
         return info
 
     @staticmethod
-    def _extract_allele_hgvs(allele):
-        """Given an <Allele> BS node, extract genomic, coding, and protein
+    def _extract_allele_hgvs(allele, elements=None):
+        """Given an <Allele> element, extract genomic, coding, and protein
         HGVS changes."""
+        elements = elements or _allele_elements(allele)
         info = {}
-        hgvs = allele.select('HGVSlist')
+        hgvs = elements['HGVSlist']
 
         if hgvs:
             hgvs = one(hgvs)
         else:
             return info
 
-        g37 = hgvs.select_one('HGVS[Assembly=GRCh37]')
-        if g37:
+        genomic_hgvs = {}
+        cds_changes = []
+        p_changes = []
+        for hgvs_element in hgvs.iterdescendants('HGVS'):
+            genomic_hgvs.setdefault(hgvs_element.get('Assembly'), hgvs_element)
+            hgvs_type = hgvs_element.get('Type')
+            if hgvs_type == 'HGVS, coding, RefSeq':
+                cds_changes.append(hgvs_element)
+            elif hgvs_type == 'HGVS, protein, RefSeq':
+                p_changes.append(hgvs_element)
+
+        g37 = genomic_hgvs.get('GRCh37')
+        if g37 is not None:
             info['genomic_change_g37'] = g37.get('Change')
             info['genomic_change_g37_accession'] = g37.get('AccessionVersion')
-            info['genomic_change_g37_name'] = g37.text
+            info['genomic_change_g37_name'] = _text(g37)
 
-        g38 = hgvs.select_one('HGVS[Assembly=GRCh38]')
-        if g38:
+        g38 = genomic_hgvs.get('GRCh38')
+        if g38 is not None:
             info['genomic_change_g38'] = g38.get('Change')
             info['genomic_change_g38_accession'] = g38.get('AccessionVersion')
-            info['genomic_change_g38_name'] = g38.text
+            info['genomic_change_g38_name'] = _text(g38)
 
-        cds_changes = hgvs.find_all('HGVS', attrs={'Type': 'HGVS, coding, RefSeq'})
         if cds_changes:
-            info['coding_changes'] = [c.text for c in cds_changes]
+            info['coding_changes'] = [_text(c) for c in cds_changes]
 
-        p_changes = hgvs.find_all('HGVS', attrs={'Type': 'HGVS, protein, RefSeq'})
         if p_changes:
-            info['protein_changes'] = [p.text for p in p_changes]
+            info['protein_changes'] = [_text(p) for p in p_changes]
 
         return info
 
     @staticmethod
-    def _extract_xrefs(allele):
-        """Given an <Allele> BS node, extract the external DB references."""
-        info = {}
-
-        dbsnp = allele.find('XRef', attrs={'DB': 'dbSNP', 'Type': 'rs'})
-        if dbsnp:
-            info['dbsnp_id'] = '{}{}'.format(dbsnp['Type'], dbsnp['ID'])
+    def _extract_xrefs(allele, elements=None):
+        """Given an <Allele> element, extract the external DB references."""
+        elements = elements or _allele_elements(allele)
 
-        omim = allele.find('XRef', attrs={'DB': 'OMIM'})
-        if omim:
-            info['omim_id'] = omim['ID']
-
-        uniprot = allele.find('XRef', attrs={'DB': 'UniProtKB'})
-        if uniprot:
-            info['uniprot_id'] = uniprot['ID']
+        # Keep the first XRef of each kind, in a single pass:
+        info = {}
+        for xref in elements['XRef']:
+            key = XREF_KEYS.get(xref.get('DB'))
+            if key is None or key in info:
+                continue
+            attrib = xref.attrib
+            if key == 'dbsnp_id':
+                if attrib.get('Type') != 'rs':
+                    continue
+                info[key] = 'rs' + attrib['ID']
+            else:
+                info[key] = attrib['ID']
 
         return info
 
 
     @staticmethod
-    def _extract_molecular_consequences(allele):
-        """Given an <Allele> BS node, extract the molecular consequences."""
+    def _extract_molecular_consequences(allele, elements=None):
+        """Given an <Allele> element, extract the molecular consequences."""
+        elements = elements or _allele_elements(allele)
         consequences = []
-        for consequence in allele.select('MolecularConsequence'):
+        for consequence in elements['MolecularConsequence']:
             info = {
-                'hgvs': consequence['HGVS'],
-                'function': consequence['Function'],
+                'hgvs': consequence.attrib['HGVS'],
+                'function': consequence.attrib['Function'],
             }
             consequences.append(info)
 
         return consequences
 
     @staticmethod
-    def _extract_allele_frequencies(allele):
+    def _extract_allele_frequencies(allele, elements=None):
+        elements = elements or _allele_elements(allele)
         freq_per_allele = defaultdict(dict)
 
-        for frequency in allele.select('AlleleFrequency'):
-            allele = frequency.get('MinorAllele')
-            if allele:
-                source = frequency['Type']
-                value = float(frequency['Value'])
-                freq_per_allele[allele][source] = value
+        for frequency in elements['AlleleFrequency']:
+            attributes = frequency.attrib
+            minor_allele = attributes.get('MinorAllele')
+            if minor_allele:
+                freq_per_allele[minor_allele][attributes['Type']] = \
+                    float(attributes['Value'])
 
         return dict(freq_per_allele)
 
     @staticmethod
     def _generate_clinical_summary(clinical_assertions):
-        seen_clinsigs = []
-        for assertion in clinical_assertions:
-            seen_clinsigs += assertion['clinical_significances']
-        return Counter(seen_clinsigs)
+        # Count all the significances in a single pass of Counter's C loop:
+        return Counter(chain.from_iterable(
+            assertion.get('clinical_significances', ())
+            for assertion in clinical_assertions
+        ))
 
     @staticmethod
     def _associated_phenotypes(clinical_assertions):
-        phenotype_names = [phenotype['name']
-                           for clinical_assertion in clinical_assertions
-                           for phenotype in clinical_assertion.get('phenotypes', [])]
-        return sorted(set(phenotype_names))
+        return sorted({phenotype['name']
+                       for clinical_assertion in clinical_assertions
+                       for phenotype in clinical_assertion.get('phenotypes', ())})
 
     @staticmethod
     def _url(variation_id):
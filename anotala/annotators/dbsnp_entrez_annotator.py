@@ -1,7 +1,7 @@
 from copy import deepcopy
 import logging
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from anotala.annotators.base_classes import EntrezAnnotator
 
@@ -29,8 +29,11 @@ class DbsnpEntrezAnnotator(EntrezAnnotator):
         { id-1: xml_fragment-1, id-2: ... }."""
         # The _ ignored argument is the list of IDs, which here is not used
         # because the ID is taken from the xml element itself.
-        soup = BeautifulSoup(xml_with_many_variants, 'lxml')
-        for xml_element in soup.select('rs'):
+        # Only the <rs> elements are kept in the tree. They are searched with
+        # find_all(), which is cheaper than CSS select() for plain tag names:
+        soup = BeautifulSoup(xml_with_many_variants, 'lxml',
+                             parse_only=SoupStrainer('rs'))
+        for xml_element in soup.find_all('rs'):
             id_ = 'rs' + xml_element['rsid']
             yield id_, str(xml_element)
 
@@ -45,7 +48,7 @@ class DbsnpEntrezAnnotator(EntrezAnnotator):
         soup = BeautifulSoup(xml_of_single_variant, 'lxml')
         ann = {}
 
-        rs_elements = soup.select('rs')
+        rs_elements = soup.find_all('rs')
         assert len(rs_elements) == 1
         e = rs_elements[0]
 
@@ -58,7 +61,7 @@ class DbsnpEntrezAnnotator(EntrezAnnotator):
         ann['alleles'] = seq.observed.text
 
         ann['links'] = {}
-        for link in e.select('rslinkout'):
+        for link in e.find_all('rslinkout'):
             resource = link['resourceid']
             resource_name = cls.LINKOUT_NAMES.get(resource, resource)
             value = link['linkvalue']
@@ -66,7 +69,7 @@ class DbsnpEntrezAnnotator(EntrezAnnotator):
             ann['links'][resource_name].append(value)
 
         ann['synonyms'] = []
-        for synonym in e.select('mergehistory'):
+        for synonym in e.find_all('mergehistory'):
             ann['synonyms'].append('rs' + synonym['rsid'])
 
         # I'm removing 'clinical significance' since I found too many
@@ -79,12 +82,12 @@ class DbsnpEntrezAnnotator(EntrezAnnotator):
         #  ann['clinical_significance'] = ','.join(clinsigs) or None
 
         ann['hgvs'] = []
-        for hgvs in e.select('hgvs'):
+        for hgvs in e.find_all('hgvs'):
             ann['hgvs'].append(hgvs.text)
 
         ann['frequency'] = e.frequency and e.frequency.attrs
 
-        ann['fxn'] = [fx.attrs for fx in e.select('fxnset')]
+        ann['fxn'] = [fx.attrs for fx in e.find_all('fxnset')]
 
         return ann
 
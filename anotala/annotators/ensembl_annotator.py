@@ -1,19 +1,55 @@
 import requests
-import json
-import time
 import logging
 import re
+from functools import partial, lru_cache
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
 
 from tqdm import tqdm
+import orjson
 import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from anotala.annotators.base_classes import WebAnnotatorWithCache
-from anotala.helpers import grouped, path_to_source_file
+from anotala.helpers import grouped, path_to_source_file, IntervalLimiter
 
 
 logger = logging.getLogger(__name__)
 
 
+def _create_ensembl_session():
+    """
+    Create a requests.Session that keeps the connections to the Ensembl REST
+    api alive between batches, and retries when the server fails temporarily.
+    """
+    retries = Retry(total=3, backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=None)  # Retry POSTs as well
+    adapter = HTTPAdapter(pool_maxsize=8, max_retries=retries)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+ENSEMBL_SESSION = _create_ensembl_session()
+
+
+@lru_cache()
+def _ensembl_url(api_version, full_info):
+    # No prefix needed for GRCh38
+    url_prefix = 'grch37.' if api_version == 'GRCh37' else ''
+    url = 'http://{}rest.ensembl.org/variation/homo_sapiens/'.format(url_prefix)
+
+    p = int(full_info) # Boolean to {0,1}
+    params = {'phenotypes': p,
+              'genotypes': p,
+              'pops': p,
+              'population_genotypes': p}
+    return url + '?' + urlencode(params)
+
+
 class EnsemblAnnotator(WebAnnotatorWithCache):
     """
     Annotates rsids with Ensembl! REST service via POST requests.
@@ -31,8 +67,13 @@ class EnsemblAnnotator(WebAnnotatorWithCache):
     # So, in case you set full_info = True for some annotation, you might need
     # to decrease BATCH_SIZE to 20 or 10.
 
+    # Minimum time between the start of two requests, shared by all the
+    # concurrent workers.
     SLEEP_TIME = 0
 
+    # Number of batches POSTed at the same time:
+    CONCURRENCY = 4
+
     api_version = 'GRCh37'
     full_info = False # Full info is way too heavy/slow for massive annotation
 
@@ -43,45 +84,50 @@ class EnsemblAnnotator(WebAnnotatorWithCache):
         if self.full_info:
             logger.warn('{} using full_info (quite slow)'.format(self.name))
 
-        for group_of_ids in tqdm(grouped(ids, self.BATCH_SIZE, as_list=True)):
-            yield self._post_query(group_of_ids)
-            time.sleep(self.SLEEP_TIME)
+        groups_of_ids = list(grouped(ids, self.BATCH_SIZE, as_list=True))
+        limiter = IntervalLimiter(self.SLEEP_TIME)
+        post_query = partial(self._post_query, url=self._query_url(),
+                             limiter=limiter)
+
+        # The batches are POSTed by CONCURRENCY threads at the same time:
+        with ThreadPoolExecutor(self.CONCURRENCY) as executor:
+            results = executor.map(post_query, groups_of_ids)
+            yield from tqdm(results, total=len(groups_of_ids))
 
-    def _post_query(self, ids):
+    def _post_query(self, ids, url=None, limiter=None):
         """
         Do a POST request to Ensembl REST api for a group of *ids*. Returns
         a dictionary with annotations per id. Requests should be done in
         batches of 1000 or less.
+
+        The connection is reused between batches through ENSEMBL_SESSION.
         """
-        # No prefix needed for GRCh38
-        url_prefix = 'grch37.' if self.api_version == 'GRCh37' else ''
-        url = ('http://{}rest.ensembl.org/variation/homo_sapiens/?'
-               .format(url_prefix))
+        if url is None:
+            url = self._query_url()
+        if limiter is not None:
+            limiter.wait()
 
         headers = {'Content-Type': 'application/json',
                    'Accept': 'application/json'}
 
-        p = int(self.full_info) # Boolean to {0,1}
-        params = {'phenotypes': p,
-                  'genotypes': p,
-                  'pops': p,
-                  'population_genotypes': p}
-        for key, value in params.items():
-            url += '{}={};'.format(key, value)
-
-        payload = {'ids': list(ids)}
+        payload = orjson.dumps({'ids': list(ids)})
 
         proxies = self.proxies or {}
 
-        response = requests.post(url, headers=headers, proxies=proxies,
-                                 data=json.dumps(payload))
+        response = ENSEMBL_SESSION.post(url, headers=headers, proxies=proxies,
+                                        data=payload)
 
         if response.ok:
-            return response.json()
+            return orjson.loads(response.content)
         else:
             logger.warn('Ensembl Error: {}'.format(response.text))
             response.raise_for_status()
 
+    def _query_url(self):
+        """Build the Ensembl REST url for the current api_version and the
+        full_info setting."""
+        return _ensembl_url(self.api_version, bool(self.full_info))
+
     @classmethod
     def _parse_annotation(cls, annotation):
         if not cls.full_info:
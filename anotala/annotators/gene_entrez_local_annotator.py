@@ -1,10 +1,21 @@
-from os.path import join, dirname
+import os
+import logging
+from tempfile import mkstemp
+from os.path import join, dirname, isfile, getmtime, splitext
 
 import pandas as pd
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 from anotala.annotators.base_classes import LocalFileAnnotator
 
 
+logger = logging.getLogger(__name__)
+
+
 class GeneEntrezLocalAnnotator(LocalFileAnnotator):
     """
     Annotates Entrez gene IDs or symbols using a local file downloaded from
@@ -16,8 +27,64 @@ class GeneEntrezLocalAnnotator(LocalFileAnnotator):
                                     'sources',
                                     'Homo_sapiens.gene_info.2019-06.tsv')
 
+    # Columns with few distinct values, stored as categories to save memory:
+    CATEGORICAL_COLUMNS = [
+        'LocusTag',
+        'chromosome',
+        'map_location',
+        'type_of_gene',
+        'Nomenclature_status',
+        'Feature_type',
+    ]
+
     def _read_file(self, path):
-        return pd.read_table(path)
+        """
+        Read the gene table at *path*. If pyarrow is installed, the table is
+        also saved as Parquet next to the TSV file, and read from there the
+        next times, as long as it's newer than the TSV. If the Parquet file
+        can't be read or written, the TSV is used.
+        """
+        if pyarrow is None:
+            return self._read_tsv(path)
+
+        # ArrowInvalid for a truncated file, ArrowNotImplementedError for a
+        # pyarrow built without zstd, OSError for the filesystem:
+        parquet_errors = (OSError, pyarrow.ArrowException)
+
+        parquet_path = splitext(path)[0] + '.parquet'
+        if isfile(parquet_path) and getmtime(parquet_path) >= getmtime(path):
+            try:
+                return pd.read_parquet(parquet_path, engine='pyarrow')
+            except parquet_errors as error:
+                logger.warning('Could not read the gene table from {}: {}'
+                               .format(parquet_path, error))
+
+        data = self._read_tsv(path)
+        try:
+            self._write_parquet(data, parquet_path)
+        except parquet_errors as error:
+            logger.warning('Could not save the gene table as Parquet: {}'
+                           .format(error))
+        return data
+
+    @staticmethod
+    def _write_parquet(data, parquet_path):
+        # Written to a temporary file in the same directory and then renamed,
+        # so that other processes reading the table never see a partial file:
+        fd, temp_path = mkstemp(dir=dirname(parquet_path), suffix='.tmp')
+        os.close(fd)
+        try:
+            data.to_parquet(temp_path, engine='pyarrow', compression='zstd')
+            os.replace(temp_path, parquet_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def _read_tsv(self, path):
+        # NCBI uses '-' for missing values, so there are no NAs to look for:
+        return pd.read_csv(path, sep='\t', engine='c', na_filter=False,
+                           dtype={column: 'category'
+                                  for column in self.CATEGORICAL_COLUMNS})
 
     def _parse_data(self, data):
         # Annotation below depends on this stringification of IDs:
@@ -28,10 +95,10 @@ class GeneEntrezLocalAnnotator(LocalFileAnnotator):
         """
         Expects a list of either gene IDs or symbols (can be a mix of both).
 
-        Returns a dataframe with data for those genes.
+        Returns a dict with the data of those genes, with their IDs as keys.
         """
-        gene_ids = []
-        gene_symbols = []
+        records_by_id = self._records_by_id
+        annotations = {}
 
         for id_ in ids_to_annotate:
             try:
@@ -40,14 +107,33 @@ class GeneEntrezLocalAnnotator(LocalFileAnnotator):
                 # agrees with the parsing in `_parse_data()` above: we convert
                 # IDs in the source data to strings!
                 int(id_)
-                gene_ids.append(str(id_))
+                gene_ids = [str(id_)]
             except ValueError:
-                gene_symbols.append(id_)
+                gene_ids = self._gene_ids_by_symbol.get(id_, [])
+
+            for gene_id in gene_ids:
+                if gene_id in records_by_id:
+                    # A copy, so the lookup can't be changed from outside:
+                    annotations[gene_id] = dict(records_by_id[gene_id])
+
+        return annotations
 
-        matching_id = self.data['GeneID'].isin(gene_ids)
-        matching_symbol = self.data['Symbol'].isin(gene_symbols)
+    # The lookups below are built once from self.data, so that each
+    # annotation is a dict lookup instead of a scan of the whole table.
 
-        df = self.data[matching_id | matching_symbol].reset_index(drop=True)
-        df = df.set_index('GeneID', drop=False)
+    @property
+    def _records_by_id(self):
+        if not hasattr(self, '_records_by_id_cache'):
+            data = self.data.set_index('GeneID', drop=False)
+            self._records_by_id_cache = data.to_dict(orient='index')
+        return self._records_by_id_cache
 
-        return df.to_dict(orient='index')
+    @property
+    def _gene_ids_by_symbol(self):
+        if not hasattr(self, '_gene_ids_by_symbol_cache'):
+            gene_ids_by_symbol = {}
+            for gene_id, symbol in zip(self.data['GeneID'],
+                                       self.data['Symbol']):
+                gene_ids_by_symbol.setdefault(symbol, []).append(gene_id)
+            self._gene_ids_by_symbol_cache = gene_ids_by_symbol
+        return self._gene_ids_by_symbol_cache
@@ -54,15 +54,17 @@ class OmimGeneAnnotator(ParallelWebAnnotator):
 
     def annotate_from_entrez_ids(self, entrez_ids, **kwargs):
         entrez_ids = set(entrez_ids)
-        omim_ids = [gene_to_mim(entrez_id) for entrez_id in entrez_ids
-                    if entrez_id in gene_to_mim()]
+        mim_map = gene_to_mim()
+        omim_ids = [mim_map[entrez_id] for entrez_id in entrez_ids
+                    if entrez_id in mim_map]
 
         diff = len(entrez_ids) - len(omim_ids)
         if diff > 0:
             logger.warning('{} of the Entrez IDs have no MIM ID.'.format(diff))
 
         annotations = self.annotate(omim_ids, **kwargs)
-        return {mim_to_gene(mim_id): annotation
+        gene_map = mim_to_gene()
+        return {gene_map[str(mim_id)]: annotation
                 for mim_id, annotation in annotations.items()}
 
     @staticmethod
@@ -38,7 +38,8 @@ class OmimVariantAnnotator(WebAnnotatorWithCache):
         gene will be a fast process.
         """
         # OMIM variant IDs are like 605557.0001, where 605557 is a gene ID
-        gene_ids = {id_.split('.')[0] for id_ in ids}
+        ids = set(ids)
+        gene_ids = {id_.partition('.')[0] for id_ in ids}
 
         # Annotate the OMIM genes where the OMIM variants are located
         gene_annotations = self.omim_gene_annotator.annotate(gene_ids)
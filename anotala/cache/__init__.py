@@ -3,6 +3,8 @@ from .sql_cache import SqlCache
 from .redis_cache import RedisCache
 from .postgres_cache import PostgresCache
 from .mysql_cache import MysqlCache
+from .sqlite_cache import SqliteCache
 from .dict_cache import DictCache
+from .tiered_cache import TieredCache, LRUCache
 from .create_cache import create_cache, AVAILABLE_CACHES
 
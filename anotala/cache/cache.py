@@ -2,6 +2,8 @@ import json
 import string
 import logging
 
+import orjson
+
 
 logger = logging.getLogger(__name__)
 
@@ -76,13 +78,28 @@ class Cache:
     def _only_printable(s):
         return ''.join(char for char in s if char in string.printable)
 
+    @classmethod
+    def _jsondump_dict_values(cls, dictionary):
+        return {key: cls._json_dumps(value) for key, value in dictionary.items()}
+
+    @classmethod
+    def _jsonload_dict_values(cls, dictionary):
+        return {key: cls._json_loads(value) for key, value in dictionary.items()}
+
     @staticmethod
-    def _jsondump_dict_values(dictionary):
-        return {key: json.dumps(value) for key, value in dictionary.items()}
+    def _json_dumps(value):
+        # orjson is several times faster than the stdlib json and dumps
+        # straight to bytes. Non-str keys are stringified, like json does.
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
 
     @staticmethod
-    def _jsonload_dict_values(dictionary):
-        return {key: json.loads(value) for key, value in dictionary.items()}
+    def _json_loads(value):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # Values cached with the stdlib json might have NaN/Infinity,
+            # which are not valid JSON and orjson refuses to read:
+            return json.loads(value)
 
     def _client_get(self):
         raise NotImplementedError
@@ -0,0 +1,56 @@
+import zlib
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Compressed annotations are prefixed with one byte that identifies the
+# format, so that blobs written with a different codec can still be read:
+ZLIB_FORMAT = b'\x01'
+ZSTD_FORMAT = b'\x02'
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 6
+
+
+def compress_annotation(annotation, as_json):
+    """
+    Serialize an *annotation* (JSON-dumped if *as_json*, utf-8 encoded if it's
+    text) and compress it with zstd, or with zlib if zstandard is not
+    installed. Returns bytes prefixed with the format byte.
+    """
+    if as_json:
+        data = orjson.dumps(annotation, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        data = annotation.encode('utf-8')
+
+    if zstandard:
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        return ZSTD_FORMAT + compressor.compress(data)
+
+    return ZLIB_FORMAT + zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_annotation(blob, as_json):
+    """
+    Inverse of compress_annotation(): decompress the *blob* according to its
+    format byte and return the text annotation, JSON-loaded if *as_json*.
+    """
+    blob = bytes(blob)  # DB drivers might return a memoryview
+    data_format, data = blob[:1], blob[1:]
+
+    if data_format == ZLIB_FORMAT:
+        data = zlib.decompress(data)
+    elif data_format == ZSTD_FORMAT:
+        if zstandard is None:
+            raise ImportError('The cached annotation is zstd-compressed. '
+                              'Please install zstandard to read it.')
+        data = zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raise ValueError('Unknown compression format: {!r}'.format(data_format))
+
+    return orjson.loads(data) if as_json else data.decode('utf-8')
@@ -1,8 +1,10 @@
 from anotala.cache import (
     MysqlCache,
     PostgresCache,
+    SqliteCache,
     RedisCache,
     DictCache,
+    TieredCache,
 )
 
 
@@ -10,7 +12,9 @@ AVAILABLE_CACHES = {
     'redis': RedisCache,
     'postgres': PostgresCache,
     'mysql': MysqlCache,
+    'sqlite': SqliteCache,
     'dict': DictCache,
+    'tiered': TieredCache,
 }
 
 AVAILABLE_CACHES['psql'] = AVAILABLE_CACHES['postgres']
@@ -1,4 +1,3 @@
-import json
 from collections import defaultdict
 
 from anotala.cache import Cache
@@ -20,13 +19,13 @@ class DictCache(Cache):
     def _client_set(self, info_dict, namespace, as_json):
         table = self.storage[namespace]
         if as_json:
-            info_dict = {k: json.dumps(v) for k, v in info_dict.items()}
+            info_dict = self._jsondump_dict_values(info_dict)
         table.update(info_dict)
 
     def _client_get(self, keys, namespace, as_json):
         table = self.storage[namespace]
         info_dict = {k: table[k] for k in keys if k in table}
         if as_json:
-            info_dict = {k: json.loads(v) for k, v in info_dict.items()}
+            info_dict = self._jsonload_dict_values(info_dict)
         return info_dict
 
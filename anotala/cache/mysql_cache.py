@@ -1,4 +1,5 @@
-from sqlalchemy.dialects.mysql import JSON, MEDIUMTEXT
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import JSON, MEDIUMTEXT, insert
 
 from anotala.cache import SqlCache
 
@@ -9,3 +10,20 @@ class MysqlCache(SqlCache):
     TEXT_TYPE = MEDIUMTEXT
     URL = '{driver}://{user}:{pass}@{host}:{port}/{db}?charset=utf8'
 
+    @staticmethod
+    def _upsert_statement(table):
+        """
+        INSERT ... ON DUPLICATE KEY UPDATE statement for the *table*, to
+        overwrite existing annotations in the same statement that writes the
+        new ones.
+        """
+        statement = insert(table)
+        return statement.on_duplicate_key_update(
+            annotation=statement.inserted.annotation,
+            last_updated=func.now()
+        )
+
+    def _write_rows(self, connection, table, rows):
+        # PyMySQL's executemany() sends the rows of an INSERT in multi-row
+        # statements, so this is a few round-trips for the whole batch:
+        connection.execute(self._upsert_statement(table), rows)
@@ -1,10 +1,82 @@
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import func, LargeBinary
+from sqlalchemy.dialects.postgresql import JSONB, BYTEA, insert
 
 from anotala.cache import SqlCache
+from anotala.cache.compression import compress_annotation, decompress_annotation
 
 
 class PostgresCache(SqlCache):
+    """
+    SqlCache for PostgreSQL.
+
+    Initialize with compress=True to store the annotations of new tables
+    compressed in a BYTEA column, instead of TEXT/JSONB. This makes the rows
+    of big annotations (e.g. ClinVar XMLs) several times smaller. Tables
+    that already exist are read and written according to their own column
+    type, so compressed and uncompressed tables can live side by side.
+    """
     CREDS_FILE = '~/.postgres_credentials.yml'
     JSON_TYPE = JSONB
     URL = '{driver}://{user}:{pass}@{host}:{port}/{db}'
 
+    def __init__(self, credentials_filepath=None, compress=False):
+        self.compress = compress
+        super().__init__(credentials_filepath)
+
+    @classmethod
+    def _engine_kwargs(cls, credentials):
+        engine_kwargs = super()._engine_kwargs(credentials)
+        # With psycopg2, make executemany() send all the rows of an INSERT
+        # in a single statement (psycopg2.extras.execute_values), instead
+        # of one round-trip per row:
+        if credentials['driver'] in ['postgresql', 'postgresql+psycopg2']:
+            engine_kwargs.setdefault('executemany_mode', 'values')
+        return engine_kwargs
+
+    def _client_get(self, ids, namespace, as_json):
+        cached_data = super()._client_get(ids, namespace, as_json)
+
+        if self._is_compressed(self._get_table(namespace, as_json=as_json)):
+            cached_data = {
+                id_: (None if blob is None
+                      else decompress_annotation(blob, as_json))
+                for id_, blob in cached_data.items()
+            }
+
+        return cached_data
+
+    def _client_set(self, info_dict, namespace, as_json):
+        if self._is_compressed(self._get_table(namespace, as_json=as_json)):
+            info_dict = {
+                id_: (None if annotation is None
+                      else compress_annotation(annotation, as_json))
+                for id_, annotation in info_dict.items()
+            }
+
+        super()._client_set(info_dict, namespace, as_json)
+
+    def _annotation_column_type(self, as_json):
+        if self.compress:
+            return BYTEA
+        return super()._annotation_column_type(as_json)
+
+    @staticmethod
+    def _is_compressed(table):
+        return isinstance(table.c.annotation.type, LargeBinary)
+
+    @staticmethod
+    def _upsert_statement(table):
+        """
+        INSERT ... ON CONFLICT (id) DO UPDATE statement for the *table*, to
+        overwrite existing annotations in the same statement that writes the
+        new ones.
+        """
+        statement = insert(table)
+        return statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={'annotation': statement.excluded.annotation,
+                  'last_updated': func.now()}
+        )
+
+    def _write_rows(self, connection, table, rows):
+        connection.execute(self._upsert_statement(table), rows)
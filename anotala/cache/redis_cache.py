@@ -1,5 +1,4 @@
 import logging
-import json
 
 import redis
 
@@ -10,8 +9,24 @@ logger = logging.getLogger(__name__)
 
 
 class RedisCache(Cache):
-    def __init__(self, host='localhost', port=6379, db=0):
-        self.client = redis.StrictRedis(host=host, port=port, db=db)
+    # Keys are read and written in chunks of this size, so that a huge
+    # batch of IDs doesn't become one giant command that stalls the server:
+    CHUNK_SIZE = 1000
+
+    # Connection pools shared by all the RedisCache instances that connect
+    # to the same (host, port, db) with the same max_connections, e.g. the
+    # caches of different annotators:
+    _connection_pools = {}
+
+    def __init__(self, host='localhost', port=6379, db=0, max_connections=16):
+        """
+        Connect to Redis at *host*:*port*, database *db*. Connections are
+        kept alive in a pool of up to *max_connections*, shared with other
+        RedisCache instances for the same database and pool size. When all
+        connections are in use, new commands wait for one to be free.
+        """
+        pool = self._connection_pool(host, port, db, max_connections)
+        self.client = redis.StrictRedis(connection_pool=pool)
         self.connection_data = self.client.connection_pool.connection_kwargs
 
         self.client.ping()  # Raises ConnectionError if server is not there
@@ -24,26 +39,51 @@ class RedisCache(Cache):
                           name=self.__class__.__name__)
 
     def _client_get(self, ids, namespace, as_json):
-        keys = [self._id_to_key(id_, namespace) for id_ in ids]
-        # Redis client returns the values in the same order as the queried keys
-        annotations = {id_: ann.decode('utf-8')
-                       for id_, ann in zip(ids, self.client.mget(keys)) if ann}
+        ids = list(ids)
+        keys = self._ids_to_keys(ids, namespace)
 
-        if as_json:
-            annotations = self._jsonload_dict_values(annotations)
+        # One MGET per chunk of keys, all sent in a single roundtrip:
+        pipe = self.client.pipeline(transaction=False)
+        for offset in range(0, len(keys), self.CHUNK_SIZE):
+            pipe.mget(keys[offset:offset+self.CHUNK_SIZE])
+        values = [value for chunk in pipe.execute() for value in chunk]
 
-        return annotations
+        # orjson reads the bytes directly, no need to decode them first:
+        load = self._json_loads if as_json else bytes.decode
+
+        # Redis client returns the values in the same order as the queried keys
+        return {id_: load(ann) for id_, ann in zip(ids, values) if ann}
 
     def _client_set(self, data_to_cache, namespace, as_json):
-        data_to_cache = {self._id_to_key(id_, namespace): value
-                         for id_, value in data_to_cache.items()}
+        keys = self._ids_to_keys(data_to_cache.keys(), namespace)
+        values = data_to_cache.values()
         if as_json:
-            data_to_cache = self._jsondump_dict_values(data_to_cache)
+            values = map(self._json_dumps, values)
+
+        items = list(zip(keys, values))
+        pipe = self.client.pipeline(transaction=False)
+        for offset in range(0, len(items), self.CHUNK_SIZE):
+            pipe.mset(dict(items[offset:offset+self.CHUNK_SIZE]))
+        pipe.execute()
 
-        self.client.mset(data_to_cache)
+    @classmethod
+    def _connection_pool(cls, host, port, db, max_connections):
+        key = (host, port, db, max_connections)
+        if key not in cls._connection_pools:
+            cls._connection_pools[key] = redis.BlockingConnectionPool(
+                host=host, port=port, db=db,
+                max_connections=max_connections,
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
+        return cls._connection_pools[key]
 
     @staticmethod
-    def _id_to_key(id_, namespace):
-        # Transform the ids to keys prefixing them with the given namespace
-        return '{}:{}'.format(namespace, id_)
+    def _ids_to_keys(ids, namespace):
+        # Transform the ids to keys prefixing them with the given namespace.
+        # Redis takes bytes keys as they are, so the prefix is encoded once:
+        prefix = '{}:'.format(namespace).encode('utf-8')
+        return [prefix + (id_ if isinstance(id_, bytes)
+                          else str(id_).encode('utf-8'))
+                for id_ in ids]
 
@@ -2,7 +2,9 @@ from os.path import expanduser, abspath
 import yaml
 import logging
 
-from sqlalchemy import Table, Column, String, Text, DateTime, MetaData, func
+import orjson
+from sqlalchemy import (Table, Column, String, Text, DateTime, MetaData, func,
+                        create_engine)
 
 from anotala.cache import Cache
 
@@ -10,6 +12,11 @@ from anotala.cache import Cache
 logger = logging.getLogger(__name__)
 
 
+def _json_serializer(value):
+    # SQLAlchemy expects the serializer to return a str
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
 class SqlCache(Cache):
     """
     Base class for PostgresCache and MysqlCache. To implement a SqlCache class,
@@ -44,6 +51,12 @@ class SqlCache(Cache):
     CREDS_FILE = None  # Overwrite this value in the subclass
     JSON_TYPE = None  # Overwrite this value in the subclass
     TEXT_TYPE = Text  # Optionally, overwrite this value in the subclass
+    # Optionally, extend these kwargs for create_engine() in the subclass.
+    # JSON fields are (de)serialized with orjson, much faster than stdlib's.
+    ENGINE_KWARGS = {
+        'json_serializer': _json_serializer,
+        'json_deserializer': orjson.loads,
+    }
 
     def __init__(self, credentials_filepath=None):
         """
@@ -74,10 +87,21 @@ class SqlCache(Cache):
         Connect to the database and read the available tables.
         Returns a SQLAlchemy MetaData instance.
         """
-        metadata = MetaData(bind=cls.URL.format(**credentials))
+        engine = create_engine(cls.URL.format(**credentials),
+                               **cls._engine_kwargs(credentials))
+        metadata = MetaData(bind=engine)
         metadata.reflect()  # Gets a list of all Tables in the database
         return metadata
 
+    @classmethod
+    def _engine_kwargs(cls, credentials):
+        """
+        Extra kwargs for SQLAlchemy's create_engine(), given the database
+        *credentials*. Subclasses can override this to tune the engine for
+        a particular driver.
+        """
+        return dict(cls.ENGINE_KWARGS)
+
     def _client_get(self, ids, namespace, as_json):
         """
         Gets data for a list of IDs in the given namespace.
@@ -110,13 +134,22 @@ class SqlCache(Cache):
         # JSON field type in case the table named *namespace* doesn't exist.
         table = self._get_table(namespace, as_json=as_json)
 
-        # We remove the keys in case they exist, before writing the new data:
-        ids_to_remove = info_dict.keys()
-        self._client_del(ids_to_remove, namespace)
-
         new_annotations = [{'id': id_, 'annotation': ann}
                            for id_, ann in info_dict.items()]
-        self.engine.execute(table.insert(), new_annotations)
+        with self.engine.begin() as connection:
+            self._write_rows(connection, table, new_annotations)
+
+    def _write_rows(self, connection, table, rows):
+        """
+        Write the *rows* (dicts with 'id' and 'annotation') to the *table*
+        in a single batch, overwriting the rows with the same IDs.
+
+        By default, existing IDs are deleted before inserting the new data.
+        Subclasses can override this with a native upsert for their database.
+        """
+        ids_to_remove = [row['id'] for row in rows]
+        connection.execute(table.delete().where(table.c.id.in_(ids_to_remove)))
+        connection.execute(table.insert(), rows)
 
     def _client_del(self, ids, namespace):
         """
@@ -145,11 +178,9 @@ class SqlCache(Cache):
 
         Returns a sqlalchemy.Table instance.
         """
-        annotation_column_type = self.JSON_TYPE if as_json else self.TEXT_TYPE
-
         Table(tablename, self.metadata,
               Column('id', String(60), primary_key=True),
-              Column('annotation', annotation_column_type),
+              Column('annotation', self._annotation_column_type(as_json)),
               Column('synonyms', self.JSON_TYPE),  # Just a list of IDs
               Column('last_updated', DateTime(timezone=True),
                      server_default=func.now(), nullable=False))
@@ -158,6 +189,12 @@ class SqlCache(Cache):
 
         return self.metadata.tables[tablename]
 
+    def _annotation_column_type(self, as_json):
+        """
+        SQLAlchemy type of the 'annotation' column for new tables.
+        """
+        return self.JSON_TYPE if as_json else self.TEXT_TYPE
+
     @staticmethod
     def _read_credentials(filepath):
         """
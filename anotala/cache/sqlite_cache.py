@@ -0,0 +1,62 @@
+from os.path import expanduser, abspath
+
+from sqlalchemy import JSON, event
+
+from anotala.cache import SqlCache
+
+
+class SqliteCache(SqlCache):
+    """
+    SqlCache in a local SQLite file. It needs no database server nor
+    credentials, just the *path* to the file, which is created if needed.
+
+    The database is opened in WAL mode, so many processes (e.g. parallel
+    pytest workers, or several annotation scripts) can read the same cache
+    while one of them writes to it.
+    """
+    DEFAULT_PATH = '~/.anotala_cache.sqlite'
+    JSON_TYPE = JSON
+    URL = 'sqlite:///{path}'
+    # Seconds to wait for another process to release the database lock:
+    TIMEOUT = 30
+
+    def __init__(self, path=None):
+        self.path = abspath(expanduser(path or self.DEFAULT_PATH))
+        self.credentials = {'path': self.path}
+        self.metadata = self._connect_to_db(self.credentials)
+        self.engine = self.metadata.bind  # Shortcut for statements execution
+
+    def __repr__(self):
+        return "{}('{}')".format(self.__class__.__name__, self.path)
+
+    @classmethod
+    def _connect_to_db(cls, credentials):
+        metadata = super()._connect_to_db(credentials)
+        event.listen(metadata.bind, 'connect', cls._set_pragmas)
+        return metadata
+
+    @classmethod
+    def _engine_kwargs(cls, credentials):
+        engine_kwargs = super()._engine_kwargs(credentials)
+        engine_kwargs.setdefault('connect_args', {'timeout': cls.TIMEOUT})
+        return engine_kwargs
+
+    @staticmethod
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # Readers don't block the writer and viceversa, and commits only
+        # fsync the write-ahead log instead of the whole database:
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.close()
+
+    @staticmethod
+    def _upsert_statement(table):
+        """
+        INSERT OR REPLACE statement for the *table*, to overwrite existing
+        annotations in the same statement that writes the new ones.
+        """
+        return table.insert().prefix_with('OR REPLACE')
+
+    def _write_rows(self, connection, table, rows):
+        connection.execute(self._upsert_statement(table), rows)
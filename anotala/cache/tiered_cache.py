@@ -0,0 +1,140 @@
+import os
+import logging
+from collections import OrderedDict, Counter
+
+from anotala.cache import Cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache(Cache):
+    """
+    In-process cache that keeps up to *maxsize* annotations in memory,
+    discarding the least recently used ones. The default size is read from
+    the env variable CACHE_MAXSIZE (10,000 annotations if not set).
+
+    JSON annotations are kept dumped as bytes, like the other caches do, so
+    that the callers get a new copy on every get and can't change the cached
+    data by modifying it (e.g. in a _parse_annotation that edits its input).
+    This cache is meant to be used as the first tier of a TieredCache.
+    """
+    DEFAULT_MAXSIZE = 10000
+
+    def __init__(self, maxsize=None):
+        if maxsize is None:
+            maxsize = int(os.environ.get('CACHE_MAXSIZE',
+                                         self.DEFAULT_MAXSIZE))
+        self.maxsize = maxsize
+        self.storage = OrderedDict()
+
+    def __repr__(self):
+        return '{}(maxsize={})'.format(self.__class__.__name__, self.maxsize)
+
+    def _client_get(self, ids, namespace, as_json):
+        info_dict = {}
+        for id_ in ids:
+            key = (namespace, id_)
+            if key in self.storage:
+                self.storage.move_to_end(key)
+                info_dict[id_] = self.storage[key]
+        if as_json:
+            info_dict = self._jsonload_dict_values(info_dict)
+        return info_dict
+
+    def _client_set(self, info_dict, namespace, as_json):
+        if as_json:
+            info_dict = self._jsondump_dict_values(info_dict)
+        for id_, annotation in info_dict.items():
+            key = (namespace, id_)
+            self.storage[key] = annotation
+            self.storage.move_to_end(key)
+
+        while len(self.storage) > self.maxsize:
+            self.storage.popitem(last=False)
+
+
+class TieredCache(Cache):
+    """
+    Cache that puts faster tiers in front of a persistent cache:
+
+        - an in-process LRUCache (L1),
+        - optionally, a RedisCache or any other Cache instance (L2),
+        - the persistent cache, by default a PostgresCache.
+
+    Reads probe the tiers in that order and backfill the faster tiers with
+    the annotations found in the slower ones. Writes go through all tiers.
+
+    If Redis is used as L2, configuring it with an eviction policy like
+    'maxmemory-policy allkeys-lfu' lets it keep the frequently used IDs.
+
+    The number of hits and misses of each tier are counted in self.hits and
+    self.misses, with the tier names as keys.
+
+    Usage:
+
+        cache = TieredCache('postgres', l2_cache='redis')
+        annotator = ClinvarVariationAnnotator(cache=cache)
+
+    """
+    def __init__(self, persistent_cache='postgres', l2_cache=None,
+                 maxsize=None, **cache_kwargs):
+        """
+        Initialize with a *persistent_cache* name or Cache instance. Extra
+        kwargs are passed to the initializer of the persistent cache. The
+        optional *l2_cache* can also be a cache name or a Cache instance.
+        The *maxsize* of the in-memory tier defaults to env CACHE_MAXSIZE.
+        """
+        # Imported here to avoid a circular import, since create_cache
+        # knows about this class:
+        from anotala.cache.create_cache import create_cache
+
+        if not isinstance(persistent_cache, Cache):
+            persistent_cache = create_cache(persistent_cache, **cache_kwargs)
+        if l2_cache is not None and not isinstance(l2_cache, Cache):
+            l2_cache = create_cache(l2_cache)
+
+        self.memory_cache = LRUCache(maxsize)
+        self.l2_cache = l2_cache
+        self.persistent_cache = persistent_cache
+
+        self.tiers = [('memory', self.memory_cache)]
+        if l2_cache is not None:
+            self.tiers.append(('l2', l2_cache))
+        self.tiers.append(('persistent', persistent_cache))
+
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def __repr__(self):
+        tiers = ', '.join(repr(cache) for _, cache in self.tiers)
+        return '{}({})'.format(self.__class__.__name__, tiers)
+
+    def get_cached_ids(self, namespace):
+        return self.persistent_cache.get_cached_ids(namespace)
+
+    def _client_get(self, ids, namespace, as_json):
+        info_dict = {}
+        missing_ids = list(ids)
+
+        for i, (tier_name, cache) in enumerate(self.tiers):
+            if not missing_ids:
+                break
+
+            found = cache._client_get(missing_ids, namespace, as_json)
+            self.hits[tier_name] += len(found)
+            self.misses[tier_name] += len(missing_ids) - len(found)
+
+            if found:
+                for _, faster_cache in self.tiers[:i]:
+                    faster_cache._client_set(found, namespace, as_json)
+                info_dict.update(found)
+                missing_ids = [id_ for id_ in missing_ids if id_ not in found]
+
+        return info_dict
+
+    def _client_set(self, info_dict, namespace, as_json):
+        # Write to the persistent cache first, so that a failure there
+        # doesn't leave data only in the volatile tiers:
+        for _, cache in reversed(self.tiers):
+            cache._client_set(info_dict, namespace, as_json)
@@ -11,3 +11,5 @@ from .rsids_from_vcf import rsids_from_vcf
 from .path_to_source_file import path_to_source_file
 from .clinvar_vcf_parser import ClinvarVCFParser
 from .infer_annotated_allele import infer_annotated_allele
+from .xml_parsing import iter_xml_elements, parse_xml
+from .interval_limiter import IntervalLimiter
@@ -1,6 +1,7 @@
 import re
 from os.path import expanduser
-from itertools import zip_longest
+from itertools import islice
+from functools import lru_cache
 
 from Bio import Entrez
 
@@ -9,16 +10,24 @@ from anotala.helpers.variation_patterns import PROT_RE
 
 def grouped(iterable, group_size, as_list=False):
     """Split an iterable in lists of <group_size> elements."""
-    # Python recipe taken from:
-    # https://docs.python.org/3.1/library/itertools.html#recipes
-    args = [iter(iterable)] * group_size
-    gen = ([e for e in t if e is not None] for t in zip_longest(*args))
+    gen = _grouped(iterable, group_size)
     if as_list:
         return list(gen)
     else:
         return gen
 
 
+def _grouped(iterable, group_size):
+    # Take consecutive slices of the iterator, so the last group is just
+    # shorter instead of being padded and filtered:
+    iterator = iter(iterable)
+    while True:
+        group = list(islice(iterator, group_size))
+        if not group:
+            return
+        yield group
+
+
 def listify(maybe_list):
     if isinstance(maybe_list, list):
         return maybe_list
@@ -61,9 +70,14 @@ def set_email_for_entrez():
         raise FileNotFoundError(msg.format(email_filepath))
 
 
+CAMEL_CASE_UPPER_RE = re.compile(r'([A-Z])')
+
+
+@lru_cache(maxsize=1024)
 def camel_to_snake(s):
     """Convert a CamelCase string to a snake_case string."""
-    return re.sub("([A-Z])", "_\\1", s).lower().lstrip('_')
+    # Cached, since the same field names are converted for every annotation
+    return CAMEL_CASE_UPPER_RE.sub(r'_\1', s).lower().lstrip('_')
 
 
 def access_deep_keys(keys, dic, sep='.', ignore_key_errors=False):
@@ -86,34 +100,35 @@ def access_deep_keys(keys, dic, sep='.', ignore_key_errors=False):
     get the result of the successful keys.
     """
     new_dic = {}
-    for queried_key in keys:
-
-        # A key with a separator character means we have to go deeper
-        if sep in queried_key:
-            key, deep_key = queried_key.split(sep, 1)
-            if deep_key == '':
-                msg = 'No key left when splitting "{}" with "{}"'
-                raise ValueError(msg.format(queried_key, sep))
-
+    for queried_key, key_path in _split_deep_keys(tuple(keys), sep):
+        # A key with separator characters means we have to go deeper, one
+        # level per separator, and there must be a key after the last one:
+        if len(key_path) > 1 and key_path[-1] == '':
+            msg = 'No key left when splitting "{}" with "{}"'
+            raise ValueError(msg.format(queried_key, sep))
+
+        value = dic
+        for i, key in enumerate(key_path[:-1]):
             if ignore_key_errors:
-                deep_dic = dic.get(key, {})
+                value = value.get(key, {})
             else:
-                deep_dic = dic[key]
+                value = value[key]
 
-            if not isinstance(deep_dic, dict):
+            if not isinstance(value, dict):
                 msg = "You ask for '{}' but '{}' is not a dictionary"
-                raise ValueError(msg.format(queried_key, key))
+                raise ValueError(msg.format(sep.join(key_path[i:]), key))
 
-            deep_values = access_deep_keys([deep_key], deep_dic, sep=sep,
-                                           ignore_key_errors=ignore_key_errors)
-            new_dic[queried_key] = deep_values[deep_key]
-
-        # A regular key with no separators in it
+        if ignore_key_errors:
+            new_dic[queried_key] = value.get(key_path[-1])
         else:
-            if ignore_key_errors:
-                new_dic[queried_key] = dic.get(queried_key)
-            else:
-                new_dic[queried_key] = dic[queried_key]
+            new_dic[queried_key] = value[key_path[-1]]
 
     return new_dic
 
+
+@lru_cache()
+def _split_deep_keys(keys, sep):
+    # The same keys are usually asked for many dictionaries (e.g. one per
+    # annotation), so they are split just once:
+    return [(key, tuple(key.split(sep))) for key in keys]
+
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from os.path import join, isfile
 from datetime import datetime
 from tempfile import gettempdir
@@ -11,8 +12,8 @@ def get_omim_incidental_genes_and_phenos():
     Visits https://www.ncbi.nlm.nih.gov/clinvar/docs/acmg/ and gets the
     genes/phenos table as a pandas.DataFrame. Updates it once a month.
     """
-    date_str = datetime.now().strftime('%Y_%m')
-    fn = join(gettempdir(), 'ACMG_incidental_genes_{}.csv'.format(date_str))
+    fn = join(gettempdir(),
+              'ACMG_incidental_genes_{}.csv'.format(_this_month()))
 
     if not isfile(fn):
         url = 'https://www.ncbi.nlm.nih.gov/clinvar/docs/acmg/'
@@ -102,8 +103,7 @@ def is_incidental_gene(gene_mim_id):
     as an incidental finding. Taken from:
     https://www.ncbi.nlm.nih.gov/clinvar/docs/acmg/
     """
-    df = get_omim_incidental_genes_and_phenos()
-    return str(gene_mim_id) in df['gene_MIM'].values
+    return str(gene_mim_id) in _incidental_mim_ids('gene_MIM', _this_month())
 
 
 def is_incidental_pheno(pheno_mim_id):
@@ -112,8 +112,24 @@ def is_incidental_pheno(pheno_mim_id):
     as an incidental finding. Taken from:
     https://www.ncbi.nlm.nih.gov/clinvar/docs/acmg/
     """
+    return str(pheno_mim_id) in _incidental_mim_ids('phenotype_MIM',
+                                                    _this_month())
+
+
+@lru_cache(maxsize=4)
+def _incidental_mim_ids(field, month):
+    """
+    Read the MIM IDs in the given *field* of the incidental findings table
+    into a frozenset. The result is cached per *month*, matching the
+    update frequency of the table, so that the CSV is not read again on
+    every call.
+    """
     df = get_omim_incidental_genes_and_phenos()
-    return str(pheno_mim_id) in df['phenotype_MIM'].values
+    return frozenset(df[field].dropna())
+
+
+def _this_month():
+    return datetime.now().strftime('%Y_%m')
 
 
 def _use_first_row_as_header(df):
@@ -0,0 +1,24 @@
+import time
+import threading
+
+
+class IntervalLimiter:
+    """
+    Make the threads that call wait() start their requests at least
+    *interval* seconds apart from each other.
+    """
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_start = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.interval
+
+        time.sleep(start - now)
@@ -33,20 +33,31 @@ def mim_to_gene_df():
     return df.set_index('mim_id')
 
 
-@lru_cache()
 def mim_to_gene(id_=None):
     """Maps OMIM IDs to Entrez gene IDs. Pass a MIM ID to get the Entrez ID or
     no args to get the whole dictionary."""
-    df = mim_to_gene_df()
-    dic = {k: v for k, v in df['entrez_id'].dropna().items()}
+    dic = _mim_to_gene_dict()
     return dic[str(id_)] if id_ else dic
 
 
-@lru_cache()
 def gene_to_mim(id_=None):
     """Maps Entrez gene IDs to OMIM IDs. Pass an Entrez ID to get the MIM ID or
     no args to get the whole dictionary."""
-    df = mim_to_gene_df()
-    dic = {v: k for k, v in df['entrez_id'].dropna().items()}
+    dic = _gene_to_mim_dict()
     return dic[str(id_)] if id_ else dic
 
+
+# The dictionaries are built only once. Caching them apart from the ID
+# lookups avoids rebuilding them for every new ID passed to the functions
+# above.
+
+@lru_cache()
+def _mim_to_gene_dict():
+    df = mim_to_gene_df()
+    return {k: v for k, v in df['entrez_id'].dropna().items()}
+
+
+@lru_cache()
+def _gene_to_mim_dict():
+    df = mim_to_gene_df()
+    return {v: k for k, v in df['entrez_id'].dropna().items()}
@@ -1,12 +1,17 @@
 from os.path import dirname, join, isfile
+from functools import lru_cache
 
 
+SOURCES_DIR = join(dirname(dirname(__file__)), 'sources')
+
+
+# The same few source files are asked for over and over. Missing files
+# raise, and exceptions are not cached, so they are checked again next time.
+@lru_cache(maxsize=256)
 def path_to_source_file(filename):
-    package_dir = dirname(dirname(__file__))
-    sources_dir = join(package_dir, 'sources')
-    filepath = join(sources_dir, filename)
+    filepath = join(SOURCES_DIR, filename)
 
     if not isfile(filepath):
-        raise Exception(f'"{filename}" not found in {sources_dir}')
+        raise Exception(f'"{filename}" not found in {SOURCES_DIR}')
 
     return filepath
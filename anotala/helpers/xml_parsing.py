@@ -0,0 +1,67 @@
+import threading
+from io import BytesIO
+
+from lxml import etree
+
+
+# lxml parsers can't be shared between threads, so each thread keeps its own
+# (see _xml_parser below):
+_thread_local = threading.local()
+
+
+def _xml_parser():
+    """
+    Return this thread's XMLParser, creating it on first use. Reusing it
+    saves setting up a new libxml2 parser context for every document.
+    """
+    parser = getattr(_thread_local, 'xml_parser', None)
+    if parser is None:
+        # Huge ClinVar reports go past libxml2 default limits. The ID
+        # attributes are not used, so they're not indexed:
+        parser = etree.XMLParser(huge_tree=True, collect_ids=False)
+        _thread_local.xml_parser = parser
+    return parser
+
+
+def parse_xml(xml):
+    """
+    Parse an *xml* document (str or bytes) and return its root lxml Element.
+    Already parsed elements are returned as they are.
+
+    This is the one place where annotators choose an XML parser, so it can
+    be changed for all of them at once.
+    """
+    if isinstance(xml, etree._Element):
+        return xml
+
+    if isinstance(xml, str):
+        # lxml refuses str input with an encoding declaration
+        xml = xml.encode('utf-8')
+
+    return etree.fromstring(xml, _xml_parser())
+
+
+def iter_xml_elements(xml, tag):
+    """
+    Given an *xml* document (str, bytes, or a binary file-like object like
+    an HTTP response), yield its <*tag*> elements one by one as lxml
+    Elements, as they are parsed. File-like objects are read in chunks, so
+    the whole document is never held in memory.
+
+    Each element is cleared after it's yielded, along with its already
+    visited siblings, so that big multi-entry responses (e.g. a batch of
+    ClinVar reports) are never fully held in memory. Hence, the yielded
+    elements are only usable until the next one is requested: serialize
+    them or extract whatever you need from them before moving on.
+    """
+    if isinstance(xml, str):
+        xml = xml.encode('utf-8')
+    if isinstance(xml, bytes):
+        xml = BytesIO(xml)
+
+    for _, element in etree.iterparse(xml, tag=tag, huge_tree=True):
+        yield element
+
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
@@ -7,20 +7,27 @@ from .group_omim_variants_by_rsid import group_omim_variants_by_rsid
 from .extract_pmids import extract_pmids
 from .annotate_pmids import annotate_pmids
 from .update_pubmed_entries import update_pubmed_entries
-from .extract_entrez_genes import extract_entrez_genes
+from .extract_entrez_genes import (
+    extract_entrez_genes,
+    extract_entrez_gene_ids_and_symbols,
+)
 from .extract_swissprot_ids import extract_swissprot_ids
 from .extract_ensembl_consequence import extract_ensembl_consequence
 from .extract_gwas_traits import extract_gwas_traits
 from .annotate_swissprot_ids import annotate_swissprot_ids
 from .group_swissprot_variants_by_rsid import group_swissprot_variants_by_rsid
 from .annotate_clinvar_accessions import annotate_clinvar_accessions
-from .generate_position_tags import generate_position_tags
+from .generate_position_tags import (
+    generate_position_tags,
+    generate_position_tags_for_variants,
+)
 from .annotate_items_with_clinvar import annotate_items_with_clinvar
 from .annotate_rsids_with_clinvar import annotate_rsids_with_clinvar
 from .annotate_position_tags_with_clinvar import annotate_position_tags_with_clinvar
 from .fix_genomic_allele_given_VCF_alleles import (
     fix_genomic_allele_given_VCF_alleles,
     fix_genomic_alleles_for_variant,
+    fix_genomic_alleles_for_variants,
 )
 
 
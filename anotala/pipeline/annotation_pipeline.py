@@ -16,7 +16,7 @@ from anotala.annotators import ClinvarRsVCFAnnotator
 from anotala.pipeline import (
     read_variants_from_vcf,
     annotate_rsids,
-    extract_entrez_genes,
+    extract_entrez_gene_ids_and_symbols,
     annotate_entrez_gene_ids,
     # get_omim_variants_from_entrez_genes,
     # group_omim_variants_by_rsid,
@@ -28,9 +28,9 @@ from anotala.pipeline import (
     group_swissprot_variants_by_rsid,
     # annotate_clinvar_accessions,
     annotate_rsids_with_clinvar,
-    generate_position_tags,
+    generate_position_tags_for_variants,
     annotate_position_tags_with_clinvar,
-    fix_genomic_alleles_for_variant
+    fix_genomic_alleles_for_variants
 )
 from anotala.helpers import gene_to_mim
 
@@ -151,7 +151,7 @@ class AnnotationPipeline:
         # annotations.
         logger.info('Fixing genomic_allele in the annotations based on the ' +
                     'VCF alleles seen at each variant.')
-        rs_variants = rs_variants.apply(fix_genomic_alleles_for_variant, axis=1)
+        rs_variants = fix_genomic_alleles_for_variants(rs_variants)
 
         self.rs_variants = rs_variants
         self.other_variants = other_variants
@@ -209,8 +209,8 @@ class AnnotationPipeline:
             rs_variants['rsid'].map(clinvar_variations_per_rsid)
 
         logger.info('Generate position tags')
-        rs_variants['position_tag'] = rs_variants.apply(
-            generate_position_tags, assembly=self.genome_assembly, axis=1)
+        rs_variants['position_tag'] = generate_position_tags_for_variants(
+            rs_variants, assembly=self.genome_assembly)
 
         logger.info('Add ClinVar Variation Reports based on position tags')
         clinvar_variations_per_position = annotate_position_tags_with_clinvar(
@@ -232,15 +232,19 @@ class AnnotationPipeline:
                             'clinvar_variations_from_position']
 
         logger.info('Extract Entrez gene data from the variants')
-        dbsnp = rs_variants['dbsnp_myvariant']
+        genes = [extract_entrez_gene_ids_and_symbols(dbsnp_entries)
+                 for dbsnp_entries in rs_variants['dbsnp_myvariant']]
         rs_variants['entrez_gene_ids'] = \
-            dbsnp.fillna(False).apply(extract_entrez_genes, field='geneid')
+            pd.Series([ids for ids, _ in genes], index=rs_variants.index)
         rs_variants['entrez_gene_symbols'] = \
-            dbsnp.fillna(False).apply(extract_entrez_genes, field='symbol')
+            pd.Series([symbols for _, symbols in genes], index=rs_variants.index)
 
         logger.info('Annotate the Entrez genes associated to the variants')
-        entrez_gene_ids = \
-            list(chain.from_iterable(rs_variants['entrez_gene_ids']))
+        # The same gene is usually found for many variants, so the gene IDs
+        # are deduplicated here (keeping the order of appearance):
+        entrez_gene_ids = list(dict.fromkeys(
+            chain.from_iterable(rs_variants['entrez_gene_ids'])
+        ))
 
         ##### NOTE: OMIM banned Tor IPs #############################
         #
@@ -253,16 +257,13 @@ class AnnotationPipeline:
         #
         logger.warning('Annotate OMIM gene entrez ids manually:')
         fn = join(gettempdir(), "gene_entrez_ids_to_annotate_with_OMIM.list")
-        with open(fn, "w") as f:
-            for id_ in entrez_gene_ids:
-                f.write(f"{id_}\n")
+        _dump_ids(entrez_gene_ids, fn)
         logger.warning(f'Entrez gene ids to annotate with OMIM dumped in: {fn}')
 
         fn = join(gettempdir(), "mim_ids_to_annotate.list")
-        with open(fn, "w") as f:
-            for id_ in entrez_gene_ids:
-                if id_ in gene_to_mim():
-                    f.write(f"{gene_to_mim(id_)}\n")
+        mim_map = gene_to_mim()
+        mim_ids = [mim_map[id_] for id_ in entrez_gene_ids if id_ in mim_map]
+        _dump_ids(mim_ids, fn)
         logger.warning(f'MIM ids to annotate with OMIM dumped in: {fn}')
         #
         ############################################################
@@ -280,7 +281,7 @@ class AnnotationPipeline:
         #  pmids = extract_pmids(omim_variants)
 
         if not gwas_annotation_enabled:
-            rs_variants['gwas_catalog'] = rs_variants["rsid"].map(lambda v: [])
+            rs_variants['gwas_catalog'] = _empty_lists(rs_variants.index)
         if gwas_annotation_enabled:
             logger.info('Extract PMIDs from the GWAS Catalog entries')
             for gwas_entries in rs_variants['gwas_catalog'].dropna():
@@ -300,7 +301,7 @@ class AnnotationPipeline:
 
         # FIXME: Delete next single line when OMIM works. This line makes
         # all omim entries empty:
-        rs_variants['omim_entries'] = rs_variants['rsid'].map(lambda v: [])
+        rs_variants['omim_entries'] = _empty_lists(rs_variants.index)
 
         if gwas_annotation_enabled:
             logger.info('Update GWAS PubMed entries with the PubMed annotations')
@@ -337,3 +338,16 @@ class AnnotationPipeline:
                     .format(format_timespan(time.time() - start_time)))
 
         return self.rs_variants
+
+
+def _empty_lists(index):
+    """Series of new empty lists (one per row, not a shared one) for an
+    *index*, without calling a Python function per row."""
+    return pd.Series([[] for _ in range(len(index))], index=index,
+                     dtype=object)
+
+
+def _dump_ids(ids, filepath):
+    """Write the *ids* to *filepath*, one per line, in a single write."""
+    with open(filepath, 'w') as f:
+        f.write(''.join(f'{id_}\n' for id_ in ids))
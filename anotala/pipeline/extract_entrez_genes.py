@@ -12,3 +12,20 @@ def extract_entrez_genes(dbsnp_entries, field='geneid'):
                               for gene in entry.get('gene', {})}
     return list(values)
 
+
+
+def extract_entrez_gene_ids_and_symbols(dbsnp_entries):
+    """
+    Like extract_entrez_genes(), but extract both the 'geneid' and the
+    'symbol' of the genes in a single walk through the *dbsnp_entries*.
+    Missing values (None or NaN) are treated as no entries.
+
+    Returns a tuple of two lists: (geneids, symbols).
+    """
+    if not isinstance(dbsnp_entries, list):
+        return [], []
+
+    genes = [gene for entry in dbsnp_entries for gene in entry.get('gene', {})]
+    geneids = {gene.get('geneid') for gene in genes}
+    symbols = {gene.get('symbol') for gene in genes}
+    return list(geneids), list(symbols)
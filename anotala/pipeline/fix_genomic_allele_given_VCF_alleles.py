@@ -1,5 +1,4 @@
 import re
-from copy import deepcopy
 import logging
 
 import pandas as pd
@@ -8,27 +7,70 @@ import pandas as pd
 logger = logging.getLogger(__name__)
 
 
+# Columns/keys of a variant that are not annotations, so they have no
+# genomic alleles to fix:
+KEYS_TO_SKIP = [
+    'chrom',
+    'pos',
+    'id',
+    'ref',
+    'alt',
+    'qual',
+    'filter',
+    'info',
+    'format',
+    'position_tag',
+    'entrez_gene_ids',
+    'entrez_gene_symbols',
+]
+
+INDEL_PREFIX = re.compile(r'ins|del')
+
+
+def fix_genomic_alleles_for_variants(variants):
+    """
+    Given a DataFrame of variants, fix the genomic alleles at all columns
+    where it's possible. Same as applying fix_genomic_alleles_for_variant
+    to each row, but it goes column by column over plain lists, instead of
+    building a pd.Series for every row. Returns a new DataFrame.
+    """
+    variants = variants.copy()
+    refs = variants['ref'].tolist()
+    alts = variants['alt'].tolist()
+
+    for key in variants.columns:
+        if key in KEYS_TO_SKIP:
+            continue
+
+        fixed_values = []
+        failures = 0
+        for value, ref, alts_of_variant in zip(variants[key].tolist(),
+                                               refs, alts):
+            try:
+                value = fix_genomic_allele_given_VCF_alleles(
+                    entry_or_entries=value, ref=ref, alts=alts_of_variant
+                )
+            except ValueError:
+                failures += 1
+            fixed_values.append(value)
+
+        if failures:
+            logger.warning(f'Genomic allele fix failed at key: "{key}" '
+                           f'({failures} variants)')
+
+        if failures < len(fixed_values):
+            variants[key] = fixed_values
+
+    return variants
+
+
 def fix_genomic_alleles_for_variant(variant):
     """
     Given a variant (pd.Series or dict), fix the genomic alleles at all
     columns/keys where it's possible. The fix happens inplace!
     """
-    keys_to_skip = [
-        'chrom',
-        'pos',
-        'id',
-        'ref',
-        'alt',
-        'qual',
-        'filter',
-        'info',
-        'format',
-        'position_tag',
-        'entrez_gene_ids',
-        'entrez_gene_symbols',
-    ]
     for key in variant.index:
-        if key in keys_to_skip:
+        if key in KEYS_TO_SKIP:
             continue
         try:
             variant[key] = fix_genomic_allele_given_VCF_alleles(
@@ -44,19 +86,23 @@ def fix_genomic_alleles_for_variant(variant):
 def fix_genomic_allele_given_VCF_alleles(entry_or_entries, ref, alts):
     """
     Given either a single entry or a list of entries, each a dictionary with
-    a 'genomic_allele', return a copy of the entry_or_entries with the genomic
-    allele "fixed" to match the alleles from the VCF (ref, alts). This is
-    meant to solve the way that some annotators name indels vs. the way
-    the VCF names indels, e.g. "insC" vs "AC" or "del" vs "A".
+    a 'genomic_allele', return the entry_or_entries with the genomic allele
+    "fixed" to match the alleles from the VCF (ref, alts). This is meant to
+    solve the way that some annotators name indels vs. the way the VCF names
+    indels, e.g. "insC" vs "AC" or "del" vs "A". The entries are not modified:
+    fixed entries are copies, and the ones that need no fix are returned as
+    they are.
 
     Returns a single dict if the input was a dict, or a list of dicts if the
     input was a list of dicts.
     """
     if isinstance(entry_or_entries, list):
-        fixed = [_fix_genomic_allele_for_single_entry(entry, ref, alts)
+        vcf_alleles = _vcf_alleles(ref, alts)
+        fixed = [_fix_genomic_allele_for_single_entry(entry, vcf_alleles)
                  for entry in entry_or_entries]
     elif isinstance(entry_or_entries, dict):
-        fixed = _fix_genomic_allele_for_single_entry(entry_or_entries, ref, alts)
+        fixed = _fix_genomic_allele_for_single_entry(entry_or_entries,
+                                                     _vcf_alleles(ref, alts))
     elif pd.isnull(entry_or_entries):
         fixed = None
     else:
@@ -67,7 +113,24 @@ def fix_genomic_allele_given_VCF_alleles(entry_or_entries, ref, alts):
     return fixed
 
 
-def _fix_genomic_allele_for_single_entry(entry, ref, alts):
+def _vcf_alleles(ref, alts):
+    """Auxiliary function. Returns the set of VCF alleles, whether they
+    describe an indel, and their common previous nucleotides, so that they
+    are computed once for all the entries of a variant."""
+    alleles = set([ref] + alts)
+
+    # VCF notation for indel includes the nucleotide previous to the mutation
+    # itself. So, for an insertion of a "C" after an "A", the alleles are
+    # "A" and "AC", and for a deletion of a "C" after an "A", the alleles are
+    # "AC", and "A". We need to match something like "insC" or "del" to "AC"
+    # and "A" respectively, detecting the nucleotide at -1 and adding it.
+    is_indel = any(len(allele) > 1 for allele in alleles)
+    common_previous_nucleotides = set(allele[0] for allele in alleles)
+
+    return alleles, is_indel, common_previous_nucleotides
+
+
+def _fix_genomic_allele_for_single_entry(entry, vcf_alleles):
     """Auxiliary function.
     See fix_genomic_allele_given_VCF_alleles for the explanation."""
     if not isinstance(entry, dict):
@@ -79,20 +142,12 @@ def _fix_genomic_allele_for_single_entry(entry, ref, alts):
     if not entry_allele:
         return entry
 
-    alleles = set([ref] + alts)
+    alleles, is_indel, common_previous_nucleotides = vcf_alleles
 
     # Do not fix an allele that's already as the VCF alleles
     if entry_allele in alleles:
         return entry
 
-    # VCF notation for indel includes the nucleotide previous to the mutation
-    # itself. So, for an insertion of a "C" after an "A", the alleles are
-    # "A" and "AC", and for a deletion of a "C" after an "A", the alleles are
-    # "AC", and "A". We need to match something like "insC" or "del" to "AC"
-    # and "A" respectively, detecting the nucleotide at -1 and adding it.
-    is_indel = any(len(allele) > 1 for allele in alleles)
-    common_previous_nucleotides = set(allele[0] for allele in alleles)
-
     # NOTE: multiallelic deletions are problematic to choose an allele:
     # from "del" given "ACCC" I can't tell if the allele is "ACC" vs "AC".
     multiallelic_del = ('del' in entry_allele) and len(alleles) > 2
@@ -101,17 +156,17 @@ def _fix_genomic_allele_for_single_entry(entry, ref, alts):
         logger.warning(f"{alleles} don't have a unique previous nucleotide?")
         common_previous_nucleotide = None
     else:
-        common_previous_nucleotide = common_previous_nucleotides.pop()
+        common_previous_nucleotide = next(iter(common_previous_nucleotides))
 
-    fixed_entry = deepcopy(entry)
-    if entry_allele and is_indel and common_previous_nucleotide and not multiallelic_del:
-        fixed_allele = re.sub(r'ins|del', '', entry_allele)
+    if is_indel and common_previous_nucleotide and not multiallelic_del:
+        fixed_allele = INDEL_PREFIX.sub('', entry_allele)
         fixed_allele = f'{common_previous_nucleotide}{fixed_allele}'
 
         if fixed_allele in alleles:
-            fixed_entry['genomic_allele'] = fixed_allele
-
-            # FIXME: debugging print
-            logger.debug(f"REF={ref}, ALT={alts}, original={entry_allele} -> fixed={fixed_allele}")
+            logger.debug(f"ALLELES={alleles}, original={entry_allele} -> "
+                         f"fixed={fixed_allele}")
+            # A shallow copy is enough: only the genomic allele changes, and
+            # the (possibly big) rest of the entry is shared as it is.
+            return {**entry, 'genomic_allele': fixed_allele}
 
-    return fixed_entry
+    return entry
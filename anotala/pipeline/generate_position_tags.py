@@ -3,8 +3,27 @@ def generate_position_tags(variant, assembly):
     Give a variant with a 'dbsnp_web' key, return a position tag like "1:10000"
     according to the chosen assembly.
     """
-    chrom_key = f'{assembly}_chrom'
-    pos_key = f'{assembly}_start'
-    chromosome = variant['dbsnp_web'].get(chrom_key) or ''
-    position = variant['dbsnp_web'].get(pos_key) or ''
+    chrom_key, pos_key = _position_keys(assembly)
+    return _position_tag(variant['dbsnp_web'], chrom_key, pos_key)
+
+
+def generate_position_tags_for_variants(variants, assembly):
+    """
+    Like generate_position_tags(), but for a DataFrame of *variants* with a
+    'dbsnp_web' column. Returns a list with a position tag per variant.
+    """
+    chrom_key, pos_key = _position_keys(assembly)
+    # Iterate the column values, rather than building a Series per row
+    # as DataFrame.apply(axis=1) would:
+    return [_position_tag(dbsnp_web, chrom_key, pos_key)
+            for dbsnp_web in variants['dbsnp_web']]
+
+
+def _position_keys(assembly):
+    return f'{assembly}_chrom', f'{assembly}_start'
+
+
+def _position_tag(dbsnp_web, chrom_key, pos_key):
+    chromosome = dbsnp_web.get(chrom_key) or ''
+    position = dbsnp_web.get(pos_key) or ''
     return f'{chromosome}:{position}'
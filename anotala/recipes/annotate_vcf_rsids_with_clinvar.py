@@ -1,4 +1,6 @@
-import json
+from collections.abc import Mapping
+
+import orjson
 
 from anotala.helpers import rsids_from_vcf
 from anotala.pipeline import annotate_rsids_with_clinvar
@@ -10,14 +12,52 @@ def annotate_vcf_rsids_with_clinvar(vcf_path, output_json_path=None,
     Given a VCF path, annotate its rs IDs with Clinvar.
 
     Returns a dictionary of annotations, or writes the results to a JSON file
-    if *output_json_path* is passed.
+    if *output_json_path* is passed. If that path ends with ".jsonl", the
+    annotations are written one per line (JSON Lines) instead of as an array.
+    JSON Lines can't be used with grouped_by_rsid=True.
     """
+    if _is_json_lines(output_json_path) and \
+            annotator_options.get('grouped_by_rsid'):
+        raise ValueError('Annotations grouped by rs ID can\'t be written '
+                         'as JSON Lines: {}'.format(output_json_path))
+
     rs_ids = rsids_from_vcf(vcf_path)
     annotations = annotate_rsids_with_clinvar(rs_ids, **annotator_options)
 
     if output_json_path:
-        with open(output_json_path, 'w') as f:
-            json.dump(annotations, f)
+        _write_annotations(annotations, output_json_path)
         return output_json_path
     else:
         return annotations
+
+
+def _is_json_lines(path):
+    return bool(path) and path.endswith('.jsonl')
+
+
+def _write_annotations(annotations, path):
+    # Each annotation is dumped on its own with orjson and written as it
+    # comes, instead of encoding the whole list with the (much slower) stdlib
+    # json encoder. Annotations grouped by rs ID come in a dictionary, which
+    # is dumped in one go:
+    json_lines = _is_json_lines(path)
+    if isinstance(annotations, Mapping):
+        if json_lines:
+            raise ValueError('A dictionary of annotations can\'t be written '
+                             'as JSON Lines: {}'.format(path))
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(annotations,
+                                 option=orjson.OPT_NON_STR_KEYS))
+        return
+
+    with open(path, 'wb') as f:
+        if not json_lines:
+            f.write(b'[')
+        for i, annotation in enumerate(annotations):
+            if i and not json_lines:
+                f.write(b',')
+            f.write(orjson.dumps(annotation, option=orjson.OPT_NON_STR_KEYS))
+            if json_lines:
+                f.write(b'\n')
+        if not json_lines:
+            f.write(b']')
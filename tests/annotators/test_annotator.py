@@ -1,3 +1,5 @@
+import pytest
+
 from anotala.annotators.base_classes import Annotator
 
 
@@ -5,3 +7,45 @@ def test_set_of_string_ids():
     ids = [1, '2']
     result = Annotator._set_of_string_ids(ids)
     assert result == {'1', '2'}
+
+
+class UppercaseAnnotator(Annotator):
+    @staticmethod
+    def _parse_annotation(annotation):
+        return annotation.upper()
+
+
+@pytest.mark.parametrize('parse_workers', ['1', '2'])
+def test_parse_annotations(monkeypatch, parse_workers):
+    monkeypatch.setenv('ANOTALA_PARSE_WORKERS', parse_workers)
+    annotations = {str(i): 'annotation-{}'.format(i) for i in range(10)}
+
+    result = UppercaseAnnotator()._parse_annotations(annotations)
+
+    assert result == {str(i): 'ANNOTATION-{}'.format(i) for i in range(10)}
+    assert list(result) == list(annotations)
+
+
+def test_parse_annotations_error_has_the_id(monkeypatch):
+    monkeypatch.setenv('ANOTALA_PARSE_WORKERS', '2')
+
+    with pytest.raises(AttributeError, match='UppercaseAnnotator.*: bad-id'):
+        UppercaseAnnotator()._parse_annotations({'ok': 'ok', 'bad-id': None})
+
+
+class MutatingAnnotator(Annotator):
+    @staticmethod
+    def _parse_annotation(annotation):
+        annotation['parsed'] = annotation.pop('raw').upper()
+        return annotation
+
+
+@pytest.mark.parametrize('parse_workers', ['1', '2'])
+def test_parse_annotations_leaves_the_input_alone(monkeypatch, parse_workers):
+    monkeypatch.setenv('ANOTALA_PARSE_WORKERS', parse_workers)
+    annotations = {'a': {'raw': 'foo'}}
+
+    result = MutatingAnnotator()._parse_annotations(annotations)
+
+    assert result == {'a': {'parsed': 'FOO'}}
+    assert annotations == {'a': {'raw': 'foo'}}
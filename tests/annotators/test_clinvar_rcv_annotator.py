@@ -1,7 +1,7 @@
 import pytest
-from bs4 import BeautifulSoup
 
 from anotala.annotators import ClinvarRCVAnnotator
+from anotala.helpers import parse_xml
 
 
 @pytest.fixture
@@ -49,7 +49,7 @@ def clinvar_set_xml():
 
 @pytest.fixture
 def clinvar_set_soup(clinvar_set_xml):
-    return BeautifulSoup(clinvar_set_xml, 'lxml-xml')
+    return parse_xml(clinvar_set_xml)
 
 
 def test_annotations_by_id(clinvar_set_xml):
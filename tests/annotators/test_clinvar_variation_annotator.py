@@ -1,13 +1,12 @@
-from bs4 import BeautifulSoup
-
 from anotala.annotators import ClinvarVariationAnnotator
+from anotala.helpers import parse_xml
 
 
 # See https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=clinvar&id=1550&rettype=variation
 # For an example of the kind of XML structure we are dealing with.
 
 def make_soup(xml):
-    return BeautifulSoup(xml, 'lxml-xml').findChildren()[0]
+    return parse_xml(xml)
 
 def test_annotations_by_id():
     variations_xml = """
@@ -82,7 +81,7 @@ def test_extract_single_gene_name():
         <VariationReport>
             <GeneList GeneCount="1">
                 <Gene Symbol="Gene-Symbol-1"></Gene>
-            <GeneList/>
+            </GeneList>
         </VariationReport>
     """)
 
@@ -94,7 +93,7 @@ def test_extract_single_gene_name():
             <GeneList GeneCount="2">
                 <Gene Symbol="Gene-Symbol-1"></Gene>
                 <Gene Symbol="Gene-Symbol-2"></Gene>
-            <GeneList/>
+            </GeneList>
         </VariationReport>
     """)
 
@@ -171,6 +170,10 @@ def test_parse_clinical_significances():
                                                              'Likely benign',
                                                              'risk factor',
                                                              'other']
+    # Repeated values are kept once, in the order they are first seen:
+    assert f('Pathogenic, risk factor/Pathogenic') == ['Pathogenic',
+                                                       'risk factor']
+    assert f(' Pathogenic / risk factor ') == ['Pathogenic', 'risk factor']
 
 
 def test_extract_clinical_assertions():
@@ -194,10 +197,10 @@ def test_extract_clinical_assertions():
 
                             <Citation Type="general">
                                 <ID Source="PubMed">123</ID>
-                            </Citation
+                            </Citation>
                             <Citation Type="general">
                                 <ID Source="PubMed">234</ID>
-                            </Citation
+                            </Citation>
                             <Comment DataSource="Comment-Source-1" Type="Comment-type">
                                 Some comment about the variant.
                             </Comment>
@@ -375,6 +378,17 @@ def test_extract_sequence_info_from_allele():
     assert result['start_g37'] == 1000
     assert result['stop_g37'] == 1000
 
+    # GRCh38 locations without start/stop don't break the parsing either
+    soup = make_soup("""
+        <Allele>
+            <SequenceLocation Assembly="GRCh38" Chr="1" Accession="NC_2" />
+        </Allele>
+    """)
+    result = ClinvarVariationAnnotator._extract_sequence_info_from_allele(soup)
+    assert 'start_g38' not in result
+    assert 'stop_g38' not in result
+    assert result['chrom_g38'] == '1'
+
 def test_extract_allele_hgvs():
     soup = make_soup("""
         <Allele>
@@ -439,6 +453,24 @@ def test_extract_xrefs():
     ClinvarVariationAnnotator._extract_xrefs(soup)
 
 
+def test_extract_xrefs_keeps_first_of_each_db():
+    soup = make_soup("""
+        <Allele>
+            <XRefList>
+                <XRef DB="dbSNP" ID="999" Type="ss" />
+                <XRef DB="OMIM" ID="Omim-1" />
+                <XRef DB="dbSNP" ID="123" Type="rs" />
+                <XRef DB="OMIM" ID="Omim-2" />
+                <XRef DB="dbSNP" ID="456" Type="rs" />
+            </XRefList>
+        </Allele>
+    """)
+
+    result = ClinvarVariationAnnotator._extract_xrefs(soup)
+
+    assert result == {'omim_id': 'Omim-1', 'dbsnp_id': 'rs123'}
+
+
 def test_extract_molecular_consequences():
     soup = make_soup("""
         <Allele>
@@ -475,6 +507,7 @@ def test_generate_clinical_summary():
         {'clinical_significances': ['ClinSig-1']},
         {'clinical_significances': ['ClinSig-1', 'ClinSig-2', 'ClinSig-3']},
         {'clinical_significances': ['ClinSig-2']},
+        {},  # Has no clinical significances, shouldn't break
     ]
 
     result = ClinvarVariationAnnotator._generate_clinical_summary(assertions)
@@ -503,3 +536,37 @@ def test_extract_dbsnp_ids_from_alleles_for_haplotypes():
     }
     ClinvarVariationAnnotator._extract_dbsnp_ids_from_alleles_for_haplotypes(info)
     assert info['dbsnp_ids'] == ['rs1', 'rs2']
+
+    # Other variation types are left untouched
+    info = {'variation_type': 'single nucleotide variant',
+            'alleles': [{'dbsnp_id': 'rs1'}]}
+    ClinvarVariationAnnotator._extract_dbsnp_ids_from_alleles_for_haplotypes(info)
+    assert 'dbsnp_ids' not in info
+
+
+def test_parse_annotation_accepts_xml_or_element():
+    variation_xml = """
+        <VariationReport VariationID="1" VariationName="Multiple Alleles">
+            <ObservationList>
+                <Observation VariationID="1" ObservationType="primary">
+                    <ClinicalSignificance>
+                        <Description>Pathogenic</Description>
+                    </ClinicalSignificance>
+                    <ReviewStatus>criteria provided</ReviewStatus>
+                    <PhenotypeList></PhenotypeList>
+                </Observation>
+            </ObservationList>
+        </VariationReport>
+    """
+    from_xml = ClinvarVariationAnnotator._parse_annotation(variation_xml)
+    from_element = \
+        ClinvarVariationAnnotator._parse_annotation(make_soup(variation_xml))
+
+    assert from_xml == from_element
+    assert from_xml['variation_id'] == '1'
+    assert from_xml['clinical_significances'] == ['Pathogenic']
+
+
+def test_parsed_annotations_are_not_cached_by_default():
+    # Cached parsed annotations would hide any later change in the parsing
+    assert not ClinvarVariationAnnotator.CACHE_PARSED_ANNOTATIONS
@@ -28,3 +28,43 @@ def test_post_parse_annotations():
     assert result['rs123'] == parsed_annotations['rs234']
     assert result['rs345'] == parsed_annotations['rs234']
 
+
+
+RAW_XML = """<ExchangeSet xmlns="https://www.ncbi.nlm.nih.gov/SNP/docsum">
+<Rs rsId="234" snpClass="snp">
+  <Sequence><Observed>A/G</Observed></Sequence>
+  <MergeHistory rsId="123"></MergeHistory>
+  <hgvs>NC_000001.10:g.100A&gt;G</hgvs>
+  <Frequency freq="0.1" allele="G" sampleSize="5008"></Frequency>
+  <RsLinkout resourceId="5" linkValue="111"></RsLinkout>
+  <RsLinkout resourceId="5" linkValue="222"></RsLinkout>
+  <RsLinkout resourceId="9" linkValue="333"></RsLinkout>
+  <Assembly><Component><MapLoc><FxnSet geneId="1" symbol="FOO">
+  </FxnSet></MapLoc></Component></Assembly>
+</Rs>
+<Rs rsId="345" snpClass="in-del">
+  <Sequence><Observed>-/T</Observed></Sequence>
+</Rs>
+</ExchangeSet>"""
+
+
+def test_annotations_by_id_and_parse_annotation():
+    raw_annotations = dict(DbsnpEntrezAnnotator._annotations_by_id(None,
+                                                                   RAW_XML))
+    assert list(raw_annotations) == ['rs234', 'rs345']
+
+    parsed = DbsnpEntrezAnnotator._parse_annotation(raw_annotations['rs234'])
+    assert parsed == {
+        'rsid': 'rs234',
+        'type': 'snp',
+        'alleles': 'A/G',
+        'links': {'pubmed': ['111', '222'], '9': ['333']},
+        'synonyms': ['rs123'],
+        'hgvs': ['NC_000001.10:g.100A>G'],
+        'frequency': {'freq': '0.1', 'allele': 'G', 'samplesize': '5008'},
+        'fxn': [{'geneid': '1', 'symbol': 'FOO'}],
+    }
+
+    parsed = DbsnpEntrezAnnotator._parse_annotation(raw_annotations['rs345'])
+    assert parsed['frequency'] is None
+    assert parsed['synonyms'] == []
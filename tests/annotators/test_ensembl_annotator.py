@@ -1,5 +1,8 @@
+import json
+
 import pandas as pd
 from anotala import EnsemblAnnotator
+from anotala.annotators import ensembl_annotator
 
 
 def test_parse_annotation():
@@ -30,6 +33,42 @@ def test_parse_annotation():
         assert key in parsed
 
 
+class FakeResponse:
+    ok = True
+
+    def __init__(self, payload):
+        ids = json.loads(payload)['ids']
+        self.content = json.dumps({id_: {'name': id_} for id_ in ids}).encode()
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def post(self, url, headers, proxies, data):
+        self.calls.append((url, json.loads(data)))
+        return FakeResponse(data)
+
+
+def test_batch_query(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(ensembl_annotator, 'ENSEMBL_SESSION', session)
+    monkeypatch.setattr(EnsemblAnnotator, 'BATCH_SIZE', 2)
+    monkeypatch.setattr(EnsemblAnnotator, 'full_info', False)
+
+    annotator = EnsemblAnnotator(cache='dict')
+    batches = list(annotator._batch_query(['rs1', 'rs2', 'rs3']))
+
+    assert batches == [{'rs1': {'name': 'rs1'}, 'rs2': {'name': 'rs2'}},
+                       {'rs3': {'name': 'rs3'}}]
+    assert [payload for _, payload in session.calls] == \
+        [{'ids': ['rs1', 'rs2']}, {'ids': ['rs3']}]
+
+    url, _ = session.calls[0]
+    assert url == ('http://grch37.rest.ensembl.org/variation/homo_sapiens/'
+                   '?phenotypes=0&genotypes=0&pops=0&population_genotypes=0')
+
+
 def test_parse_1KG_sample_name():
     result = EnsemblAnnotator.parse_1KG_sample_name('foo')
     assert result == 'foo'
@@ -0,0 +1,139 @@
+from io import BytesIO, TextIOWrapper
+
+from anotala.annotators.base_classes import entrez_annotator
+from anotala.annotators.base_classes.entrez_annotator import EntrezAnnotator
+
+
+class FakeResponse:
+    def __init__(self, content, content_type):
+        self.raw = BytesIO(content)
+        self.encoding = 'utf-8'
+        self.headers = {'Content-Type': content_type}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def get(self, url, params, stream):
+        self.calls.append(('GET', url, params))
+        return self.response
+
+    def post(self, url, data, stream):
+        self.calls.append(('POST', url, data))
+        return self.response
+
+
+class FakeLimiter:
+    def __init__(self):
+        self.calls = []  # list.append is thread-safe
+
+    def wait(self):
+        self.calls.append(True)
+
+    @property
+    def waits(self):
+        return len(self.calls)
+
+
+def test_entrez_request(monkeypatch):
+    session = FakeSession(FakeResponse(b'<xml/>', 'text/xml; charset=UTF-8'))
+    monkeypatch.setattr(entrez_annotator, 'ENTREZ_SESSION', session)
+    limiters = {False: FakeLimiter(), True: FakeLimiter()}
+    monkeypatch.setattr(entrez_annotator, 'ENTREZ_LIMITERS', limiters)
+    monkeypatch.setenv('NCBI_API_KEY', 'some-key')
+
+    handle = EntrezAnnotator._entrez_request('efetch', db='clinvar', id='1,2')
+    assert handle.read() == b'<xml/>'
+
+    method, url, params = session.calls[-1]
+    assert method == 'POST'
+    assert url.endswith('/entrez/eutils/efetch.fcgi')
+    assert params['id'] == '1,2'
+    assert params['db'] == 'clinvar'
+    assert params['api_key'] == 'some-key'
+
+    EntrezAnnotator._entrez_request('epost', db='clinvar', id='1,2')
+    method, url, _ = session.calls[-1]
+    assert method == 'POST'
+    assert url.endswith('/entrez/eutils/epost.fcgi')
+
+    EntrezAnnotator._entrez_request('efetch', db='clinvar', webenv='W',
+                                    query_key='1', retstart=0, retmax=10)
+    method, _, params = session.calls[-1]
+    assert method == 'GET'
+    assert params['webenv'] == 'W'
+
+    session.response = FakeResponse(b'foo', 'text/plain')
+    handle = EntrezAnnotator._entrez_request('efetch', db='pubmed', id='1')
+    assert isinstance(handle, TextIOWrapper)
+    assert handle.read() == 'foo'
+
+    # Every request waited for the API key's limiter before being sent:
+    assert limiters[True].waits == len(session.calls)
+    assert limiters[False].waits == 0
+
+    monkeypatch.delenv('NCBI_API_KEY')
+    monkeypatch.setattr(entrez_annotator.Entrez, 'api_key', None)
+    EntrezAnnotator._entrez_request('efetch', db='pubmed', id='1')
+    assert limiters[False].waits == 1
+
+
+def test_entrez_limiters():
+    limiters = entrez_annotator.ENTREZ_LIMITERS
+    assert limiters[False].interval == 1 / 3
+    assert limiters[True].interval == 1 / 10
+
+
+class FakeEntrezAnnotator(EntrezAnnotator):
+    SOURCE_NAME = 'fake_entrez'
+    ENTREZ_SERVICE = 'efetch'
+    ENTREZ_PARAMS = {'db': 'fake'}
+    BATCH_SIZE = 2
+
+    @staticmethod
+    def _annotations_by_id(ids, raw_response):
+        for id_, annotation in zip(ids, raw_response.decode().split(',')):
+            yield id_, annotation.upper()
+
+
+def test_entrez_annotator_batch_query(monkeypatch):
+    def fake_entrez_request(service, **params):
+        assert service == 'efetch'
+        return BytesIO(params['id'].encode())
+
+    monkeypatch.setattr(entrez_annotator.Entrez, 'email', 'foo@bar.com')
+    monkeypatch.setattr(FakeEntrezAnnotator, '_entrez_request',
+                        staticmethod(fake_entrez_request))
+
+    annotator = FakeEntrezAnnotator(cache='dict')
+    batches = list(annotator._batch_query(['a', 'b', 'c', 'd', 'e']))
+
+    assert len(batches) == 3
+    annotations = {k: v for batch in batches for k, v in batch.items()}
+    assert annotations == {'a': 'A', 'b': 'B', 'c': 'C', 'd': 'D', 'e': 'E'}
+
+
+def test_entrez_annotator_batch_query_is_rate_limited(monkeypatch):
+    session = FakeSession(None)
+
+    def post(url, data, stream):
+        session.calls.append(('POST', url, data))
+        return FakeResponse(data['id'].encode(), 'text/xml')
+
+    monkeypatch.setattr(session, 'post', post)
+    monkeypatch.setattr(entrez_annotator, 'ENTREZ_SESSION', session)
+    limiters = {False: FakeLimiter(), True: FakeLimiter()}
+    monkeypatch.setattr(entrez_annotator, 'ENTREZ_LIMITERS', limiters)
+    monkeypatch.setattr(entrez_annotator.Entrez, 'email', 'foo@bar.com')
+
+    annotator = FakeEntrezAnnotator(cache='dict')
+    batches = list(annotator._batch_query(['a', 'b', 'c', 'd', 'e']))
+
+    # Each of the concurrent workers waited for its turn before its request:
+    assert len(batches) == len(session.calls) == 3
+    assert limiters[False].waits + limiters[True].waits == 3
@@ -40,3 +40,51 @@ def test_annotate_many_ids(annotator):
     assert result['1']['Symbol'] == 'GENE1'
     assert result['2']['GeneID'] == '2'
     assert result['2']['Symbol'] == 'GENE2'
+
+
+def test_annotate_many_ids_ignores_unknown_genes(annotator):
+    result = annotator._annotate_many_ids(['GENE2', '999', 'NO-GENE'])
+    assert list(result) == ['2']
+
+    # Changing an annotation doesn't change the next ones
+    result['2']['Symbol'] = 'changed'
+    assert annotator._annotate_many_ids(['2'])['2']['Symbol'] == 'GENE2'
+
+
+def test_read_file_saves_parquet(annotator, tmp_path):
+    pytest.importorskip('pyarrow')
+    tsv_path = tmp_path / 'genes.tsv'
+    fp = pytest.helpers.file('Homo_sapiens.gene_info.mock.tsv')
+    with open(fp) as f:
+        tsv_path.write_text(f.read())
+
+    data = annotator._read_file(str(tsv_path))
+    assert (tmp_path / 'genes.parquet').exists()
+
+    # The second time, data is read from the Parquet file
+    tsv_path.write_text('broken file')
+    (tmp_path / 'genes.parquet').touch()
+    from_parquet = annotator._read_file(str(tsv_path))
+    pd.testing.assert_frame_equal(from_parquet, data)
+
+    # No temporary files are left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == \
+        ['genes.parquet', 'genes.tsv']
+
+
+def test_read_file_falls_back_to_tsv(annotator, tmp_path):
+    pytest.importorskip('pyarrow')
+    tsv_path = tmp_path / 'genes.tsv'
+    fp = pytest.helpers.file('Homo_sapiens.gene_info.mock.tsv')
+    with open(fp) as f:
+        tsv_path.write_text(f.read())
+
+    # A truncated Parquet file, newer than the TSV
+    parquet_path = tmp_path / 'genes.parquet'
+    parquet_path.write_bytes(b'PAR1')
+
+    data = annotator._read_file(str(tsv_path))
+    pd.testing.assert_frame_equal(data, annotator._read_tsv(str(tsv_path)))
+
+    # The Parquet file was written again from the TSV
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), data)
@@ -1,6 +1,8 @@
+import threading
+
 import pytest
 
-from anotala.annotators.base_classes import WebAnnotatorWithCache
+from anotala.annotators.base_classes import Annotator, WebAnnotatorWithCache
 
 
 @pytest.fixture
@@ -22,3 +24,81 @@ def test_get_cached_ids(annotator):
         }
     }
     assert annotator.get_cached_ids() == set(['foo', 'bar'])
+
+
+
+class ParsedCachingAnnotator(WebAnnotatorWithCache):
+    SOURCE_NAME = 'annotator-bar'
+    CACHE_PARSED_ANNOTATIONS = True
+
+    def _batch_query(self, ids):
+        yield {id_: 'web:' + id_ for id_ in ids}
+
+    @staticmethod
+    def _parse_annotation(annotation):
+        return {'parsed': annotation.upper()}
+
+
+def test_cache_parsed_annotations(monkeypatch):
+    parsed_ids = []
+
+    def parse_annotations(self, annotations):
+        # Sequential version of Annotator._parse_annotations
+        parsed_ids.extend(annotations)
+        return {id_: self._parse_annotation(annotation)
+                for id_, annotation in annotations.items()}
+
+    monkeypatch.setattr(Annotator, '_parse_annotations', parse_annotations)
+    annotator = ParsedCachingAnnotator('dict')
+
+    result = annotator.annotate(['foo', 'bar'])
+    assert result == {'foo': {'parsed': 'WEB:FOO'},
+                      'bar': {'parsed': 'WEB:BAR'}}
+    assert sorted(parsed_ids) == ['bar', 'foo']
+
+    # Cached annotations are not parsed again:
+    parsed_ids.clear()
+    assert annotator.annotate(['foo', 'bar']) == result
+    assert parsed_ids == []
+
+    # Annotations fetched again from web are:
+    assert annotator.annotate(['foo'], use_cache=False) == \
+        {'foo': {'parsed': 'WEB:FOO'}}
+    assert parsed_ids == ['foo']
+
+
+class BatchAnnotator(WebAnnotatorWithCache):
+    SOURCE_NAME = 'annotator-baz'
+
+    def _batch_query(self, ids):
+        for id_ in sorted(ids):
+            yield {id_: 'web:' + id_}
+
+
+def test_cache_writes_in_background(monkeypatch):
+    annotator = BatchAnnotator('dict')
+    writes = []
+
+    def cache_set(info_dict, namespace, as_json):
+        writes.append((threading.current_thread(), list(info_dict)))
+
+    monkeypatch.setattr(annotator.cache, 'set', cache_set)
+
+    result = annotator.annotate(['foo', 'bar', 'baz'])
+    assert result == {'bar': 'web:bar', 'baz': 'web:baz', 'foo': 'web:foo'}
+
+    # Written in the same order the batches were fetched, off the main thread
+    assert [ids for _, ids in writes] == [['bar'], ['baz'], ['foo']]
+    assert all(thread is not threading.main_thread() for thread, _ in writes)
+
+
+def test_cache_write_errors_are_raised(monkeypatch):
+    annotator = BatchAnnotator('dict')
+
+    def cache_set(info_dict, namespace, as_json):
+        raise IOError('Cache is down')
+
+    monkeypatch.setattr(annotator.cache, 'set', cache_set)
+
+    with pytest.raises(IOError):
+        annotator.annotate(['foo'])
@@ -79,3 +79,15 @@ def test_set(namespace, test_data, as_json):
         assert cached_data[k] == test_data[k]
 
 
+
+
+def test_json_dumps_and_loads():
+    mock_cache = create_cache('mock_cache')
+    value = {'key1': [1, None], 2: 'int-key'}
+
+    dumped = mock_cache._json_dumps(value)
+    # Non-str keys are stringified, as the stdlib json does:
+    assert mock_cache._json_loads(dumped) == json.loads(json.dumps(value))
+    # Values dumped by the stdlib json are still read:
+    assert mock_cache._json_loads(json.dumps(value)) == {'key1': [1, None],
+                                                         '2': 'int-key'}
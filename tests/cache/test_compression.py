@@ -0,0 +1,22 @@
+import pytest
+
+from anotala.cache.compression import (
+    compress_annotation,
+    decompress_annotation,
+)
+
+
+@pytest.mark.parametrize('annotation,as_json', [
+    ('<VariationReport VariationID="1"/>' * 100, False),
+    ({'foo': ['bar', 1, None], 'baz': {'qux': 1.5}}, True),
+])
+def test_compress_annotation(annotation, as_json):
+    blob = compress_annotation(annotation, as_json)
+    assert isinstance(blob, bytes)
+    assert decompress_annotation(blob, as_json) == annotation
+    assert decompress_annotation(memoryview(blob), as_json) == annotation
+
+
+def test_decompress_annotation_unknown_format():
+    with pytest.raises(ValueError):
+        decompress_annotation(b'\xff' + b'foo', as_json=False)
@@ -2,7 +2,7 @@ import json
 import pytest
 import redis
 
-from anotala.cache import create_cache
+from anotala.cache import create_cache, RedisCache
 
 
 TEST_PARAMS = [
@@ -67,3 +67,80 @@ def test_redis_get(namespace, test_data, as_json):
 
     cleanup_redis_cache(redis_cache, namespace)
 
+
+
+class FakePipeline:
+    def __init__(self, storage):
+        self.storage = storage
+        self.commands = []
+
+    def mget(self, keys):
+        self.commands.append(('mget', keys))
+
+    def mset(self, mapping):
+        self.commands.append(('mset', mapping))
+
+    def execute(self):
+        results = []
+        for command, arg in self.commands:
+            if command == 'mget':
+                results.append([self.storage.get(key) for key in arg])
+            else:
+                self.storage.update({k: v if isinstance(v, bytes)
+                                     else v.encode('utf-8')
+                                     for k, v in arg.items()})
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.storage = {}
+        self.pipelines = []
+
+    def pipeline(self, transaction):
+        assert not transaction
+        self.pipelines.append(FakePipeline(self.storage))
+        return self.pipelines[-1]
+
+
+@pytest.mark.parametrize('test_data,namespace,as_json', TEST_PARAMS)
+def test_redis_chunked_get_and_set(monkeypatch, namespace, test_data,
+                                   as_json):
+    redis_cache = RedisCache.__new__(RedisCache)
+    redis_cache.client = FakeRedis()
+    monkeypatch.setattr(RedisCache, 'CHUNK_SIZE', 1)
+
+    redis_cache._client_set(test_data, namespace, as_json)
+    pipe = redis_cache.client.pipelines[-1]
+    assert len(pipe.commands) == len(test_data)
+
+    ids = list(test_data) + ['missing-id']
+    assert redis_cache._client_get(ids, namespace, as_json) == test_data
+    pipe = redis_cache.client.pipelines[-1]
+    assert len(pipe.commands) == len(ids)
+
+
+def test_redis_ids_to_keys():
+    keys = RedisCache._ids_to_keys(['rs1', 123, b'rs2'], 'ns')
+    assert keys == [b'ns:rs1', b'ns:123', b'ns:rs2']
+
+
+def test_redis_json_loads():
+    assert RedisCache._json_loads(b'{"a": [1, null]}') == {'a': [1, None]}
+    # Values written by stdlib's json can have NaN:
+    result = RedisCache._json_loads(json.dumps({'a': float('nan')}).encode())
+    assert result['a'] != result['a']
+
+
+def test_redis_connection_pool_is_shared():
+    pool = RedisCache._connection_pool('some-host', 1234, 0, 4)
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 4
+    assert RedisCache._connection_pool('some-host', 1234, 0, 4) is pool
+    assert RedisCache._connection_pool('some-host', 1234, 1, 4) is not pool
+
+    # A different pool size is not silently ignored:
+    bigger_pool = RedisCache._connection_pool('some-host', 1234, 0, 64)
+    assert bigger_pool is not pool
+    assert bigger_pool.max_connections == 64
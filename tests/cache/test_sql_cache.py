@@ -1,6 +1,8 @@
 import pytest
+from sqlalchemy import MetaData, Table, Column, String, Text, DateTime
+from sqlalchemy.dialects import postgresql, mysql
 
-from anotala.cache import SqlCache
+from anotala.cache import SqlCache, PostgresCache, MysqlCache, SqliteCache
 
 
 TEST_PARAMS = [
@@ -52,3 +54,56 @@ def test_read_credentials():
     # Check sensible defaults were loaded
     assert result['port'] == 3306
     assert result['driver'] == 'mysql+pymysql'
+
+
+def test_postgres_cache_upsert_statement():
+    table = Table('_anotala_test', MetaData(),
+                  Column('id', String(60), primary_key=True),
+                  Column('annotation', Text))
+    statement = PostgresCache._upsert_statement(table)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+    assert 'ON CONFLICT (id) DO UPDATE' in sql
+    assert 'annotation = excluded.annotation' in sql
+
+
+def test_mysql_cache_upsert_statement():
+    table = Table('_anotala_test', MetaData(),
+                  Column('id', String(60), primary_key=True),
+                  Column('annotation', Text),
+                  Column('last_updated', DateTime))
+    statement = MysqlCache._upsert_statement(table)
+    sql = str(statement.compile(dialect=mysql.dialect()))
+    assert 'ON DUPLICATE KEY UPDATE' in sql
+    assert 'annotation = VALUES(annotation)' in sql
+
+
+def test_postgres_cache_engine_kwargs():
+    kwargs = PostgresCache._engine_kwargs({'driver': 'postgresql'})
+    assert kwargs['executemany_mode'] == 'values'
+    assert kwargs['json_deserializer'](kwargs['json_serializer']({'a': 1})) \
+        == {'a': 1}
+
+    kwargs = PostgresCache._engine_kwargs({'driver': 'postgresql+pg8000'})
+    assert 'executemany_mode' not in kwargs
+
+
+@pytest.mark.parametrize('test_data,namespace,as_json', TEST_PARAMS)
+def test_sqlite_cache(tmp_path, test_data, namespace, as_json):
+    cache = SqliteCache(str(tmp_path / 'cache.sqlite'))
+    _test_cache_operations(cache, test_data, namespace, as_json)
+
+
+def test_sqlite_cache_overwrites_and_persists(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    cache = SqliteCache(path)
+    cache.set({'rs1': 'old', 'rs2': 'foo'}, '_anotala_test', as_json=False)
+    cache.set({'rs1': 'new'}, '_anotala_test', as_json=False)
+
+    # A new instance, like another process, reads the same data:
+    cache = SqliteCache(path)
+    assert cache.get(['rs1', 'rs2'], '_anotala_test', as_json=False) == \
+        {'rs1': 'new', 'rs2': 'foo'}
+    assert cache.get_cached_ids('_anotala_test') == {'rs1', 'rs2'}
+
+    journal_mode = cache.engine.execute('PRAGMA journal_mode').scalar()
+    assert journal_mode == 'wal'
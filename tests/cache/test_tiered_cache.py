@@ -0,0 +1,78 @@
+from collections import Counter
+
+from anotala.annotators.base_classes import WebAnnotatorWithCache
+from anotala.cache import create_cache, DictCache, TieredCache, LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    cache.set({'a': 'A', 'b': 'B'}, 'ns', as_json=False)
+    cache.get(['a'], 'ns', as_json=False)  # 'a' is now the most recent
+    cache.set({'c': 'C'}, 'ns', as_json=False)
+
+    assert cache.get(['a', 'b', 'c'], 'ns', as_json=False) == \
+        {'a': 'A', 'c': 'C'}
+
+
+def test_lru_cache_maxsize_from_env(monkeypatch):
+    monkeypatch.setenv('CACHE_MAXSIZE', '5')
+    assert LRUCache().maxsize == 5
+
+
+def test_tiered_cache_get():
+    persistent_cache = DictCache()
+    persistent_cache.set({'a': {'foo': 1}, 'b': {'foo': 2}}, 'ns',
+                         as_json=True)
+    l2_cache = DictCache()
+    cache = TieredCache(persistent_cache, l2_cache=l2_cache)
+
+    result = cache.get(['a', 'b', 'c'], 'ns', as_json=True)
+    assert result == {'a': {'foo': 1}, 'b': {'foo': 2}}
+    assert cache.hits == Counter({'persistent': 2})
+    assert cache.misses == Counter({'memory': 3, 'l2': 3, 'persistent': 1})
+
+    # The faster tiers were backfilled with the hits
+    assert l2_cache.get_cached_ids('ns') == {'a', 'b'}
+
+    result = cache.get(['a', 'b'], 'ns', as_json=True)
+    assert result == {'a': {'foo': 1}, 'b': {'foo': 2}}
+    assert cache.hits['memory'] == 2
+    assert cache.hits['persistent'] == 2
+
+
+def test_tiered_cache_set():
+    cache = create_cache('tiered', persistent_cache='dict',
+                         l2_cache=DictCache())
+    cache.set({'a': 'A'}, 'ns', as_json=False)
+
+    for _, tier in cache.tiers:
+        assert tier.get(['a'], 'ns', as_json=False) == {'a': 'A'}
+    assert cache.get_cached_ids('ns') == {'a'}
+
+
+class MutatingParserAnnotator(WebAnnotatorWithCache):
+    SOURCE_NAME = 'annotator-mutating'
+    ANNOTATIONS_ARE_JSON = True
+
+    def _batch_query(self, ids):
+        yield {id_: {'id': id_, 'extra': 'foo'} for id_ in ids}
+
+    @staticmethod
+    def _parse_annotation(annotation):
+        del annotation['extra']
+        return annotation
+
+
+def test_tiered_cache_keeps_its_own_copies():
+    cache = TieredCache(DictCache())
+    annotator = MutatingParserAnnotator(cache=cache)
+
+    expected = {'a': {'id': 'a'}}
+    assert annotator.annotate(['a']) == expected
+
+    # The parser changed the annotations from the web and from the memory
+    # tier, but not the cached data:
+    assert annotator.annotate(['a']) == expected
+    assert cache.hits['memory'] == 1
+    assert cache.get(['a'], 'annotator-mutating', as_json=True) == \
+        {'a': {'id': 'a', 'extra': 'foo'}}
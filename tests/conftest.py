@@ -6,22 +6,49 @@ import pytest
 from sqlalchemy.exc import OperationalError
 
 from anotala.cache import create_cache
-from anotala.cache import DictCache
+from anotala.cache import DictCache, SqliteCache
 from anotala.cache import AVAILABLE_CACHES
 
 
 AVAILABLE_CACHES['mock_cache'] = AVAILABLE_CACHES['dict']
 
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'webtest: the test connects to the web services (slow)'
+    )
+
+
+def pytest_collection_modifyitems(items):
+    # Every test under tests_that_use_web is a webtest, so they can be
+    # (de)selected with -m, e.g. `pytest tests -m "not webtest"`:
+    for item in items:
+        if 'tests_that_use_web' in item.nodeid:
+            item.add_marker(pytest.mark.webtest)
+
+
 @pytest.fixture(scope='module')
 def proxies():
     return {'http': 'socks5://caladan.local:9050'}
 
 
-_common_dict_cache = DictCache()
-@pytest.fixture
+# One DictCache shared by all the tests that ask for it, so annotations
+# cached by one test are found by the next ones:
+@pytest.fixture(scope='session')
 def dict_cache():
-    return _common_dict_cache
+    cache = DictCache()
+    yield cache
+    cache.storage.clear()
+
+
+# A SqliteCache kept in pytest's own cache dir (.pytest_cache), so the web
+# annotations are not downloaded again on the next run, and are shared by
+# parallel pytest-xdist workers. Run pytest with --cache-clear to start from
+# scratch:
+@pytest.fixture(scope='session')
+def persistent_cache(request):
+    cache_dir = request.config.cache.mkdir('anotala')
+    return SqliteCache(str(cache_dir / 'web_annotations.sqlite'))
 
 
 @pytest.helpers.register
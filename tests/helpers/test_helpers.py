@@ -8,6 +8,8 @@ from anotala.helpers import (
     listify,
     parse_prot_change,
     grouped,
+    access_deep_keys,
+    camel_to_snake,
 )
 
 
@@ -89,3 +91,39 @@ def test_grouped():
     result = grouped(items, 3, as_list=True)
     assert result == [[1, 2, 3], [4]]  # No None items, a shorter last group
 
+    result = grouped(iter(range(5)), 2, as_list=True)
+    assert result == [[0, 1], [2, 3], [4]]
+
+
+def test_access_deep_keys():
+    dic = {'foo': 1, 'bar': {'baz': 2, 'qux': {'ham': 3}}}
+
+    result = access_deep_keys(['foo', 'bar.baz', 'bar.qux.ham'], dic)
+    assert result == {'foo': 1, 'bar.baz': 2, 'bar.qux.ham': 3}
+
+    result = access_deep_keys(['bar/qux/ham'], dic, sep='/')
+    assert result == {'bar/qux/ham': 3}
+
+    result = access_deep_keys(['foo', 'nope', 'nope.deeper', 'bar.nope'], dic,
+                              ignore_key_errors=True)
+    assert result == {'foo': 1, 'nope': None, 'nope.deeper': None,
+                      'bar.nope': None}
+
+    with pytest.raises(KeyError):
+        access_deep_keys(['bar.nope'], dic)
+
+    with pytest.raises(ValueError):
+        access_deep_keys(['foo.baz'], dic)
+
+    with pytest.raises(ValueError):
+        access_deep_keys(['bar.'], dic)
+
+
+@pytest.mark.parametrize('camel,snake', [
+    ('FooBar', 'foo_bar'),
+    ('fooBar', 'foo_bar'),
+    ('GeneID', 'gene_i_d'),
+    ('foo', 'foo'),
+])
+def test_camel_to_snake(camel, snake):
+    assert camel_to_snake(camel) == snake
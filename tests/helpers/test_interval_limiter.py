@@ -0,0 +1,34 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from anotala.helpers import IntervalLimiter
+
+
+def test_interval_limiter():
+    limiter = IntervalLimiter(0.01)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.02
+
+
+def test_interval_limiter_is_shared_by_threads():
+    limiter = IntervalLimiter(0.01)
+
+    def timed_wait(_):
+        limiter.wait()
+        return time.monotonic()
+
+    with ThreadPoolExecutor(4) as executor:
+        starts = sorted(executor.map(timed_wait, range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.009 for gap in gaps)
+
+
+def test_interval_limiter_without_interval():
+    limiter = IntervalLimiter(0)
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.wait()
+    assert time.monotonic() - start < 0.01
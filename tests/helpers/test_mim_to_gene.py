@@ -0,0 +1,32 @@
+import sys
+
+import pandas as pd
+
+from anotala.helpers import mim_to_gene, gene_to_mim
+
+
+def test_mim_to_gene_and_gene_to_mim(monkeypatch):
+    module = sys.modules['anotala.helpers.mim_to_gene']
+    df = pd.DataFrame({'mim_id': ['100', '200', '300'],
+                       'entrez_id': ['1', None, '3']}).set_index('mim_id')
+    calls = []
+
+    def fake_mim_to_gene_df():
+        calls.append(1)
+        return df
+
+    monkeypatch.setattr(module, 'mim_to_gene_df', fake_mim_to_gene_df)
+    module._mim_to_gene_dict.cache_clear()
+    module._gene_to_mim_dict.cache_clear()
+
+    assert mim_to_gene() == {'100': '1', '300': '3'}
+    assert mim_to_gene(300) == '3'
+    assert gene_to_mim() == {'1': '100', '3': '300'}
+    assert gene_to_mim('1') == '100'
+    assert gene_to_mim(3) == '300'
+
+    # Each dictionary is built just once
+    assert len(calls) == 2
+
+    module._mim_to_gene_dict.cache_clear()
+    module._gene_to_mim_dict.cache_clear()
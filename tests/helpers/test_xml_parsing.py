@@ -0,0 +1,42 @@
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from anotala.helpers import iter_xml_elements, parse_xml
+from anotala.helpers.xml_parsing import _xml_parser
+
+
+def test_iter_xml_elements():
+    xml = """<?xml version="1.0" encoding="UTF-8" ?>
+        <Result-Set>
+            <Entry ID="1"><Name>Entry-1</Name></Entry>
+            <Entry ID="2"><Name>Entry-2</Name></Entry>
+        </Result-Set>
+    """
+    result = [(element.get('ID'), element.findtext('Name'))
+              for element in iter_xml_elements(xml, 'Entry')]
+    assert result == [('1', 'Entry-1'), ('2', 'Entry-2')]
+
+    # Bytes are parsed as well:
+    elements = iter_xml_elements(xml.encode('utf-8'), 'Entry')
+    assert [element.get('ID') for element in elements] == ['1', '2']
+
+    # And file-like objects:
+    elements = iter_xml_elements(BytesIO(xml.encode('utf-8')), 'Entry')
+    assert [element.get('ID') for element in elements] == ['1', '2']
+
+
+def test_parse_xml():
+    xml = '<?xml version="1.0" encoding="UTF-8" ?><Entry ID="1"/>'
+    element = parse_xml(xml)
+    assert element.tag == 'Entry'
+    assert parse_xml(xml.encode('utf-8')).get('ID') == '1'
+    assert parse_xml(element) is element
+
+
+def test_xml_parser_is_reused_per_thread():
+    parser = _xml_parser()
+    assert _xml_parser() is parser
+
+    with ThreadPoolExecutor(1) as executor:
+        other_parser = executor.submit(_xml_parser).result()
+    assert other_parser is not parser
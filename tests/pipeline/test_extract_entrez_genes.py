@@ -1,4 +1,7 @@
-from anotala.pipeline import extract_entrez_genes
+from anotala.pipeline import (
+    extract_entrez_genes,
+    extract_entrez_gene_ids_and_symbols,
+)
 
 
 def test_extract_entrez_genes():
@@ -13,3 +16,17 @@ def test_extract_entrez_genes():
     symbols = extract_entrez_genes(dbsnp_entries, field='symbol')
     assert set(symbols) == {'GENE-1', 'GENE-2'}
 
+
+
+def test_extract_entrez_gene_ids_and_symbols():
+    dbsnp_entries = [
+        {'gene': [{'geneid': 1, 'symbol': 'GENE-1'}]},
+        {'gene': [{'geneid': 2, 'symbol': 'GENE-2'}]},
+    ]
+
+    ids, symbols = extract_entrez_gene_ids_and_symbols(dbsnp_entries)
+    assert set(ids) == {1, 2}
+    assert set(symbols) == {'GENE-1', 'GENE-2'}
+
+    assert extract_entrez_gene_ids_and_symbols(None) == ([], [])
+    assert extract_entrez_gene_ids_and_symbols(float('nan')) == ([], [])
@@ -5,6 +5,7 @@ import numpy as np
 
 from anotala.pipeline import (
     fix_genomic_alleles_for_variant,
+    fix_genomic_alleles_for_variants,
     fix_genomic_allele_given_VCF_alleles
 )
 
@@ -25,6 +26,32 @@ def test_fix_genomic_alleles_for_variant():
     assert result['entry'] == {'genomic_allele': 'AC'}
 
 
+def test_fix_genomic_alleles_for_variants():
+    variants = pd.DataFrame([
+        {'ref': 'A', 'alt': ['AC'], 'string': 'string', 'int': 1,
+         'entries': [{'genomic_allele': 'insC'}],
+         'entry': {'genomic_allele': 'insC'}},
+        {'ref': 'AC', 'alt': ['A'], 'string': 'other', 'int': 2,
+         'entries': None,
+         'entry': {'genomic_allele': 'del'}},
+    ])
+    result = fix_genomic_alleles_for_variants(variants)
+
+    assert result['string'].tolist() == ['string', 'other']
+    assert result['int'].tolist() == [1, 2]
+    assert result['entries'].tolist() == [[{'genomic_allele': 'AC'}], None]
+    assert result['entry'].tolist() == [{'genomic_allele': 'AC'},
+                                        {'genomic_allele': 'A'}]
+
+    # Same result as fixing each variant on its own
+    expected = variants.apply(fix_genomic_alleles_for_variant, axis=1)
+    for key in ['entries', 'entry']:
+        assert result[key].tolist() == expected[key].tolist()
+
+    # The original DataFrame is left untouched
+    assert variants.loc[0, 'entry'] == {'genomic_allele': 'insC'}
+
+
 def test_fix_genomic_allele_given_VCF_alleles():
     f = fix_genomic_allele_given_VCF_alleles
 
@@ -57,6 +84,13 @@ def test_fix_genomic_allele_given_VCF_alleles():
     result = f(deletion, ref='ACC', alts=['A', 'AC'])
     assert result['genomic_allele'] == 'del' # If ambiguous, don't choose
 
+    # Fixed entries are copies, the rest are returned untouched
+    insertion = {'genomic_allele': 'insC', 'other_key': {'foo': 'bar'}}
+    result = f(insertion, ref='A', alts=['AC'])
+    assert result == {'genomic_allele': 'AC', 'other_key': {'foo': 'bar'}}
+    assert insertion['genomic_allele'] == 'insC'
+    assert f(already_ok, ref='AC', alts=['ACC']) is already_ok
+
     multiple_entries = [{'genomic_allele': 'insC'},
                         {'genomic_allele': 'insCC'}]
     result = f(multiple_entries, ref='A', alts=['AC', 'ACC'])
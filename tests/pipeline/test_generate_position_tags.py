@@ -1,4 +1,9 @@
-from anotala.pipeline import generate_position_tags
+import pandas as pd
+
+from anotala.pipeline import (
+    generate_position_tags,
+    generate_position_tags_for_variants,
+)
 
 
 def test_generate_position_tags():
@@ -21,3 +26,13 @@ def test_generate_position_tags():
                               'GRCh38.p7_stop': 220}}
     result = generate_position_tags(variant2, assembly='GRCh38.p7')
     assert result == '2:220'
+
+
+def test_generate_position_tags_for_variants():
+    variants = pd.DataFrame({'dbsnp_web': [
+        {'GRCh37.p13_chrom': '1', 'GRCh37.p13_start': 100},
+        {'GRCh37.p13_chrom': 'X'},
+    ]})
+    result = generate_position_tags_for_variants(variants,
+                                                 assembly='GRCh37.p13')
+    assert result == ['1:100', 'X:']
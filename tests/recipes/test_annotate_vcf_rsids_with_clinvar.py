@@ -3,7 +3,8 @@ import json
 import pytest
 
 from anotala.recipes.annotate_vcf_rsids_with_clinvar import (
-    annotate_vcf_rsids_with_clinvar
+    annotate_vcf_rsids_with_clinvar,
+    _write_annotations,
 )
 
 
@@ -32,3 +33,34 @@ def test_annotate_vcf_rsids_with_clinvar(vcf_path, dict_cache):
         assert annotations[0]['dbsnp_id'] == 'rs268'
     finally:
         os.remove(out_fn)
+
+
+@pytest.mark.parametrize('annotations', [
+    [{'dbsnp_id': 'rs1', 'genes': [1, 2]}, {'dbsnp_id': 'rs2'}],
+    [],
+])
+def test_write_annotations(tmp_path, annotations):
+    json_path = str(tmp_path / 'annotations.json')
+    _write_annotations(annotations, json_path)
+    with open(json_path) as f:
+        assert json.load(f) == annotations
+
+    jsonl_path = str(tmp_path / 'annotations.jsonl')
+    _write_annotations(annotations, jsonl_path)
+    with open(jsonl_path) as f:
+        assert [json.loads(line) for line in f] == annotations
+
+
+def test_write_grouped_annotations(tmp_path):
+    annotations = {'rs1': [{'variation_id': '1'}], 'rs2': []}
+    json_path = str(tmp_path / 'annotations.json')
+    _write_annotations(annotations, json_path)
+    with open(json_path) as f:
+        assert json.load(f) == annotations
+
+    with pytest.raises(ValueError):
+        _write_annotations(annotations, str(tmp_path / 'annotations.jsonl'))
+
+    with pytest.raises(ValueError):
+        annotate_vcf_rsids_with_clinvar('foo.vcf', grouped_by_rsid=True,
+                                        output_json_path='foo.jsonl')
@@ -1,16 +1,56 @@
+import vcr
 from anotala import ClinvarVariationAnnotator
 
 import pytest
 
 
-@pytest.fixture
-def annotator():
-    return ClinvarVariationAnnotator(cache='dict')
+# The annotator and its result are shared by the tests of this module, so
+# the variation is fetched only once. Its cache is a new DictCache, so the
+# responses always come from the cassette below, and the parsing, which is
+# what these tests check, runs every time. Against the live service
+# (--disable-vcr), the persistent cache keeps the responses between runs:
+@pytest.fixture(scope='module')
+def annotator(request):
+    if request.config.getoption('--disable-vcr', False):
+        cache = request.getfixturevalue('persistent_cache')
+    else:
+        cache = 'dict'
+    return ClinvarVariationAnnotator(cache=cache)
 
 
-def test_annotate(annotator):
-    result = annotator.annotate_one('1550')
+# All the variations used in this module, fetched together in one batch:
+VARIATION_IDS = ['1550']
 
+
+# The ClinVar responses are meant to be replayed from this cassette. It's not
+# recorded yet: the first run needs network access to record it (vcrpy's
+# 'once' mode), and then it should be committed along with the tests. Until
+# then, these tests query the live service like the other web tests.
+# Pass pytest-vcr's options --disable-vcr to skip the cassette, or
+# --vcr-record to record it again:
+CASSETTE = 'tests/web/cassettes/ClinvarVariationAnnotator_{}.yaml'.format(
+    '-'.join(VARIATION_IDS)
+)
+
+
+@pytest.fixture(scope='module')
+def annotations(request, annotator):
+    if request.config.getoption('--disable-vcr', False):
+        return annotator.annotate(VARIATION_IDS)
+
+    record_mode = request.config.getoption('--vcr-record', None) or 'once'
+    with vcr.use_cassette(CASSETTE, record_mode=record_mode,
+                          filter_query_parameters=['api_key'],
+                          filter_post_data_parameters=['api_key']):
+        return annotator.annotate(VARIATION_IDS)
+
+
+@pytest.fixture(scope='module')
+def result(annotations):
+    return annotations['1550']
+
+
+def test_variation_identity(result):
     assert result['name'] == 'NM_000237.2(LPL):c.953A>G (p.Asn318Ser)'
 
     # Extracted from the variation name:
@@ -24,6 +64,8 @@ def test_annotate(annotator):
     assert 'c.953A>G' in result['variation_name']
     assert result['variation_type'] == 'Simple'
 
+
+def test_genes(result):
     assert len(result['genes']) == 1
     gene = result['genes'][0]
     assert gene['symbol'] == 'LPL'
@@ -32,6 +74,8 @@ def test_annotate(annotator):
     assert gene['strand'] == '+'
     assert gene['hgnc_id'] == '6677'
 
+
+def test_clinical_assertions(result):
     assert len(result['clinical_assertions']) == 2
     clin = result['clinical_assertions'][0]
     assert clin['clinical_significances'] == ['Pathogenic']
@@ -47,6 +91,8 @@ def test_annotate(annotator):
 
     assert result['clinical_summary'] == {'Pathogenic': 2}
 
+
+def test_alleles(result):
     alleles = result['alleles']
     assert len(alleles) == 1
     allele = alleles[0]
@@ -62,5 +108,6 @@ def test_annotate(annotator):
     assert allele['variant_type'] == 'single nucleotide variant'
     assert allele['consequences'][0]['function'] == 'missense variant'
 
-    assert result['associated_phenotypes'] == ['Hyperapobetalipoproteinemia']
 
+def test_associated_phenotypes(result):
+    assert result['associated_phenotypes'] == ['Hyperapobetalipoproteinemia']